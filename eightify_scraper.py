@@ -1,11 +1,16 @@
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, StaleElementReferenceException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException,
+    StaleElementReferenceException,
+    NoSuchElementException,
+    NoSuchWindowException,
+    InvalidSessionIdException,
+)
 from selenium.webdriver.common.action_chains import ActionChains
 import time
 import json
@@ -15,16 +20,24 @@ import subprocess
 import sys
 import traceback
 import logging
-import urllib.request
-import zipfile
+import logging.handlers
 import shutil
-import glob
 import warnings
 import functools
+import io
 import random
 import importlib.util
 import math
 import re
+import asyncio
+import atexit
+import concurrent.futures
+import contextlib
+import hashlib
+import queue
+import signal
+import tempfile
+import threading
 
 # Configure logging with more structured format
 logging.basicConfig(
@@ -32,42 +45,84 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S'
 )
+
+# Route records through a queue drained by a dedicated listener thread:
+# scraper threads just enqueue (cheap, non-blocking) instead of holding
+# the GIL through synchronous terminal writes, which matters once the
+# worker pool logs concurrently
+_log_queue = queue.Queue(-1)
+_root_logger = logging.getLogger()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, *_root_logger.handlers, respect_handler_level=True)
+_root_logger.handlers = [logging.handlers.QueueHandler(_log_queue)]
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 # Create a logger
 logger = logging.getLogger('eightify_scraper')
 selenium_logger = logging.getLogger('selenium')
 selenium_logger.setLevel(logging.CRITICAL)
 
-# Check if selenium-stealth is installed, if not try to install it
+# Stealth mode is optional; install selenium-stealth alongside the other
+# requirements to enable it. Running pip at import time cost seconds on
+# every start, so a missing package now just logs a warning instead.
 try:
     from selenium_stealth import stealth
     has_stealth = True
 except ImportError:
     has_stealth = False
-    logger.warning("selenium-stealth not found. Will attempt to install it.")
-    try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "selenium-stealth"])
-        from selenium_stealth import stealth
-        has_stealth = True
-        logger.info("Successfully installed selenium-stealth")
-    except Exception as e:
-        logger.error(f"Failed to install selenium-stealth: {e}")
-        logger.warning("Will continue without stealth mode. Detection risk is higher.")
+    logger.warning(
+        "selenium-stealth not found. Continuing without stealth mode; "
+        "install it with 'pip install selenium-stealth' to reduce detection risk."
+    )
+
+# orjson serializes JSON several times faster than the stdlib and always
+# emits UTF-8; fall back to the json module when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# psutil lets Chrome cleanup wait for the processes to actually exit
+# instead of sleeping a fixed two seconds; optional like orjson
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# diskcache backs the per-URL result cache with a TTL, so recently
+# scraped videos skip the browser entirely on re-runs; optional too
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+# Pretty-printed output is opt-in: indentation inflates multi-megabyte
+# result files and slows every save, so compact JSON is the default
+PRETTY_JSON = os.environ.get("EIGHTIFY_PRETTY_JSON") == "1"
+_JSON_INDENT = 2 if PRETTY_JSON else None
+_JSON_SEPARATORS = None if PRETTY_JSON else (',', ':')
 
 # Constants
 WAIT_TIME_LOAD = 15
 WAIT_TIME_EXTENSION = 10
 WAIT_TIME_PROCESSING = 20
 WAIT_TIME_TAB_CONTENT = 5
+RESULTS_FLUSH_SECONDS = 5.0
+RESULTS_FLUSH_COUNT = 10
 WAIT_TIME_ALL_CONTENT = 10
 WAIT_TIME_RECOVERY = 3
 MIN_CONTENT_LENGTH = 50
 
 # Eightify tab types
-TAB_TYPES = [
+TAB_TYPES = (
     "key_insights",
     "timestamped_summary",
     "top_comments",
-    "transcript"]
+    "transcript")
+
+# The per-video output schema mirrors the tab set one-to-one
+RESULT_KEYS = TAB_TYPES
 
 # Selectors
 IFRAME_SELECTORS = [
@@ -80,9 +135,13 @@ IFRAME_SELECTORS = [
 
 TAB_SELECTORS = ".SummaryTabsView_item__Zjswl, .SummaryTabsView_tabs__69LdY > div, button[role='tab'], .tab, div[role='tab']"
 
+# Ordered by observed hit rate: the Eightify panel class matches almost
+# every time, so the batched queries resolve on the first sub-selector.
+# "body" is deliberately absent — serializing the whole body text through
+# chromedriver is expensive and callers fall back to it explicitly
 CONTENT_SELECTORS = [
-    ".tab-content",
     ".SummaryTabsView_content__6OYs8",
+    ".tab-content",
     "[class*='content']",
     ".content",
     "[data-testid='content']",
@@ -90,8 +149,7 @@ CONTENT_SELECTORS = [
     "[role='tabpanel']",
     "div[id*='panel']",
     "div[class*='panel']",
-    "main",
-    "body"
+    "main"
 ]
 
 SUMMARIZE_BUTTON_SELECTORS = [
@@ -115,6 +173,81 @@ CONTENT_SECTION_HEADERS = {
     "transcript": ["Transcript", "Full Transcript", "Video Transcript", "CC"]
 }
 
+# Every section header flattened once at import, plus a single compiled
+# alternation over them and a reverse map, so section scans make one
+# regex pass instead of one substring scan per header
+_ALL_HEADERS = tuple(
+    header
+    for headers in CONTENT_SECTION_HEADERS.values()
+    for header in headers)
+SECTION_HEADER_RE = re.compile(
+    r"\b(" + "|".join(re.escape(header) for header in _ALL_HEADERS) + r")\b",
+    re.I)
+# Keyed casefolded to pair with the case-insensitive match above, since
+# the captured text keeps the page's casing ("KEY INSIGHTS", "Transcript")
+HEADER_TO_TAB_TYPE = {
+    header.casefold(): tab_type
+    for tab_type, headers in CONTENT_SECTION_HEADERS.items()
+    for header in headers
+}
+
+# Precompiled pattern for resetting the t= URL parameter; anchored to a
+# separator so it cannot touch other parameters that merely end in t=
+_T_PARAM_RE = re.compile(r'([?&])t=\d+[smh]?')
+
+# One-pass transcript grammar: either a timestamp line paired with the
+# line that follows it, or a plain text line on its own. A single
+# finditer walk over the whole text replaces per-line Python scanning
+_TRANSCRIPT_LINE_RE = re.compile(
+    r'^[ \t\r]*(?P<timestamp>\d{1,2}(?::\d{2}){1,2})[ \t\r]*\n(?P<text>[^\n]*)'
+    r'|^(?P<plain>[^\n]+)',
+    re.MULTILINE)
+
+# UI chrome lines that must not end up in the structured transcript
+_SKIP_LINES = frozenset({"", "transcript", "show transcript", "hide transcript"})
+
+# Keywords that suggest an extension is Eightify, plus a bytes-level
+# pre-filter so most manifests are rejected without a JSON parse
+EIGHTIFY_KEYWORDS = (
+    'eightify',
+    'eight',
+    'transcript',
+    'summary',
+    'youtube transcript',
+    'summarize')
+_EIGHTIFY_KEYWORD_RE = re.compile(rb"eightify|eight|transcript|summar", re.I)
+
+
+def _locator(selector):
+    """Classify a selector string into a (By, selector) locator tuple"""
+    return (By.XPATH if selector.startswith("//") else By.CSS_SELECTOR, selector)
+
+
+# Union of the Eightify-specific iframe selectors: one querySelector per
+# poll instead of one find_elements round-trip per selector
+EIGHTIFY_IFRAME_CSS = ", ".join(IFRAME_SELECTORS[:3])
+
+# Fused single-string CSS unions resolved once at import so the browser
+# evaluates all candidate selectors with one querySelectorAll, returning
+# matches ordered by document position
+CONTENT_CSS_UNION = ", ".join(CONTENT_SELECTORS)
+IFRAME_CSS_UNION = ", ".join(IFRAME_SELECTORS)
+EXISTING_CONTENT_CSS = ".SummaryTabsView_content__6OYs8, [class*='content'], .tab-content"
+
+# Precomputed (By, selector) locators so hot loops don't re-classify
+# selector strings on every call
+IFRAME_LOCATORS = tuple(_locator(s) for s in IFRAME_SELECTORS)
+CONTENT_LOCATORS = tuple(_locator(s) for s in CONTENT_SELECTORS)
+SUMMARIZE_BUTTON_LOCATORS = tuple(_locator(s) for s in SUMMARIZE_BUTTON_SELECTORS)
+
+# The summarize selectors split by kind and as a flat scan-order tuple,
+# so hot paths never re-test startswith('//') or rebuild selector lists
+_SUMMARIZE_CSS = tuple(
+    s for s in SUMMARIZE_BUTTON_SELECTORS if not s.startswith('//'))
+_SUMMARIZE_XPATH = tuple(
+    s for s in SUMMARIZE_BUTTON_SELECTORS if s.startswith('//'))
+SUMMARIZE_SELECTOR_STRINGS = tuple(s for _, s in SUMMARIZE_BUTTON_LOCATORS)
+
 # List of common user agents to rotate
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/109.0.0.0 Safari/537.36",
@@ -128,24 +261,36 @@ USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Edge/111.0.1661.54"
 ]
 
+# URL patterns to block via CDP: the scraper only needs the page DOM and
+# the Eightify iframe, never the video stream, thumbnails or analytics
+BLOCKED_URL_PATTERNS = [
+    "*.googlevideo.com/*",
+    "*doubleclick*",
+    "*google-analytics*",
+    "*.jpg",
+    "*.jpeg",
+    "*.png",
+    "*.webp",
+    "*.gif",
+    "*.svg",
+    "*.mp4",
+    "*.m4s",
+    "*.webm",
+    "*.ts",
+    "*.woff",
+    "*.woff2",
+]
+
+# Platform name resolved once at import; platform.system() can shell
+# out or read files on some platforms, so per-call lookups add up on
+# the per-URL path
+SYSTEM = platform.system()
+
 # Global driver that will stay in scope
 global_driver = None
 
 # Helper Functions for Selenium Operations
 
-# Cache function results for optimization
-def cache_result(func):
-    """Cache function results to avoid redundant operations"""
-    cache = {}
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        key = str(args) + str(kwargs)
-        if key not in cache:
-            cache[key] = func(*args, **kwargs)
-        return cache[key]
-    return wrapper
-
-
 def apply_stealth_settings(driver):
     """Apply stealth settings to make automation harder to detect"""
     if has_stealth:
@@ -164,17 +309,62 @@ def apply_stealth_settings(driver):
             logger.error(f"Failed to apply stealth settings: {e}")
 
 
-def find_elements_by_selector(driver, selector):
-    """Find elements using CSS or XPath selector"""
+def _enlarge_connection_pool(driver, maxsize=20):
+    """
+    Widen the urllib3 pool behind the WebDriver HTTP connection
+
+    The default per-host maxsize of 1 serializes Selenium commands and
+    spams "connection pool is full" warnings whenever a responsiveness
+    probe overlaps a page operation. Best effort: the pool manager is a
+    private attribute, so failures are logged and ignored.
+    """
     try:
-        if selector.startswith("//"):
-            # XPath selector
-            return driver.find_elements(By.XPATH, selector)
-        else:
-            # CSS selector
-            return driver.find_elements(By.CSS_SELECTOR, selector)
+        conn = getattr(driver.command_executor, '_conn', None)
+        if conn is None:
+            return
+        conn.connection_pool_kw['maxsize'] = maxsize
+        conn.clear()
+        logger.debug(f"Widened WebDriver connection pool to {maxsize}")
+    except Exception as pool_error:
+        logger.debug(f"Could not widen WebDriver connection pool: {pool_error}")
+
+
+def apply_network_blocking(driver):
+    """Block media and analytics downloads via CDP to cut page weight"""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd(
+            "Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        # Nothing a scrape does should ever hit the disk via downloads
+        driver.execute_cdp_cmd(
+            "Page.setDownloadBehavior", {"behavior": "deny"})
+        logger.debug("Applied CDP network blocking rules")
+    except Exception as e:
+        logger.error(f"Failed to apply network blocking: {e}")
+
+
+def _body_inner_text(driver):
+    """
+    Read the current document's body text in one browser call
+
+    Deliberately uses execute_script rather than CDP Runtime.evaluate:
+    most callers run inside the Eightify iframe context, and a raw CDP
+    evaluate targets the top frame's default context, which would read
+    the wrong document.
+
+    Returns:
+        str: Body innerText, or '' when there is no body yet
+    """
+    return driver.execute_script(
+        "return document.body ? document.body.innerText : '';")
+
+
+def find_elements_by_selector(driver, locator):
+    """Find elements using a precomputed (By, selector) locator tuple"""
+    try:
+        return driver.find_elements(*locator)
     except Exception as e:
-        logger.error(f"Error finding elements with selector {selector}: {e}")
+        logger.error(f"Error finding elements with selector {locator[1]}: {e}")
         return []
 
 
@@ -196,95 +386,137 @@ def wait_for_element(driver, selector, timeout=10, by_type=None):
         return None
 
 
-def find_and_click_button_optimized(driver, selectors, purpose=None, wait_time=5):
+# JavaScript that walks the ordered selector list (CSS or XPath) in-browser,
+# clicks the first visible candidate and returns the selector that matched.
+# One execute_script round-trip replaces per-selector find_elements plus a
+# per-button is_displayed() call
+CLICK_FIRST_VISIBLE_JS = """
+var sels = arguments[0];
+function tryClick(el) {
+    if (el.offsetParent !== null && el.getClientRects().length) {
+        el.click();
+        return true;
+    }
+    return false;
+}
+for (var i = 0; i < sels.length; i++) {
+    var s = sels[i];
+    if (s.indexOf('//') === 0) {
+        var res = document.evaluate(
+            s, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (var j = 0; j < res.snapshotLength; j++) {
+            if (tryClick(res.snapshotItem(j))) return s;
+        }
+    } else {
+        var els = document.querySelectorAll(s);
+        for (var k = 0; k < els.length; k++) {
+            if (tryClick(els[k])) return s;
+        }
+    }
+}
+return null;
+"""
+
+
+# Fallback scan for when none of the known Summarize selectors match:
+# walk the visible button-like elements and click the first whose text
+# mentions Summarize/Generate. Eightify's class names churn between
+# releases but the button copy is far more stable
+CLICK_SUMMARIZE_BY_TEXT_JS = """
+var els = document.querySelectorAll('button, div[role="button"]');
+for (var i = 0; i < els.length; i++) {
+    var el = els[i];
+    if (el.offsetParent !== null && el.getClientRects().length
+            && /Summarize|Generate/i.test(el.textContent)) {
+        el.click();
+        return el.textContent.trim();
+    }
+}
+return null;
+"""
+
+
+def find_and_click_button(driver, locators, purpose=None, wait_time=5):
     """
-    Find and click a button using optimized selector prioritization with direct JavaScript
+    Find and click a button with a single in-browser scan over all selectors
     """
-    button_clicked = False
     purpose_str = f" {purpose}" if purpose else ""
-    
-    for selector in selectors:
-        if button_clicked:
-            break
-                
+
+    try:
+        matched = driver.execute_script(
+            CLICK_FIRST_VISIBLE_JS, [selector for _, selector in locators])
+    except Exception as e:
+        logger.error(f"Error scanning button selectors{purpose_str}: {e}")
+        matched = None
+
+    if matched:
+        logger.info(f"Clicked button{purpose_str} with selector: {matched}")
+
+        # Wait for page to stabilize
         try:
-            buttons = find_elements_by_selector(driver, selector)
-            for button in buttons:
-                try:
-                    if button.is_displayed():
-                        logger.info(f"Found button{purpose_str} with selector: {selector}")
-                        
-                        # Direct JavaScript click
-                        driver.execute_script("arguments[0].click();", button)
-                        
-                        button_clicked = True
-                        logger.info(f"Clicked button{purpose_str}")
-                        
-                        # Wait for page to stabilize
-                        try:
-                            WebDriverWait(driver, wait_time).until(
-                                lambda d: d.execute_script("return document.readyState") == "complete"
-                            )
-                        except TimeoutException:
-                            time.sleep(wait_time)
-                        break
-                except StaleElementReferenceException:
-                    # Skip stale elements
-                    continue
-        except Exception as e:
-            logger.error(f"Error with button selector {selector}{purpose_str}: {e}")
+            WebDriverWait(driver, wait_time).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
+        except TimeoutException:
+            # The wait already consumed its budget; don't sleep it again
+            pass
+        return True
 
-    if not button_clicked and purpose:
+    if purpose:
         logger.warning(f"Could not find button for {purpose}")
-        
-    return button_clicked
 
+    return False
 
-def find_and_click_button(driver, selectors, purpose=None, wait_time=5):
-    """
-    Try to find and click a button using a list of selectors
-    """
-    button_clicked = False
-    purpose_str = f" {purpose}" if purpose else ""
 
-    for selector in selectors:
-        if button_clicked:
-            break
+# JavaScript that checks every iframe selector in one pass and returns the
+# document-order index and id of the first visible Eightify candidate, so
+# Python does a single round-trip instead of one per selector plus
+# per-iframe is_displayed()/get_attribute() calls
+FIND_EIGHTIFY_IFRAME_JS = """
+var sels = arguments[0];
+var all = document.querySelectorAll('iframe');
+for (var i = 0; i < sels.length; i++) {
+    var els = document.querySelectorAll(sels[i]);
+    for (var j = 0; j < els.length; j++) {
+        var e = els[j];
+        if (e.offsetParent !== null &&
+                (e.id === 'eightify-iframe' || sels[i] === 'iframe')) {
+            return {idx: Array.prototype.indexOf.call(all, e), id: e.id};
+        }
+    }
+}
+return null;
+"""
 
-        try:
-            buttons = find_elements_by_selector(driver, selector)
-            for button in buttons:
-                if button.is_displayed():
-                    logger.info(f"Found button{purpose_str} with selector: {selector}")
-                    
-                    # Direct JavaScript click
-                    driver.execute_script("arguments[0].click();", button)
-                    
-                    button_clicked = True
-                    logger.info(f"Clicked button{purpose_str}")
-                    
-                    # Wait for changes after clicking
-                    try:
-                        WebDriverWait(driver, wait_time).until(
-                            lambda d: d.execute_script(
-                                "return document.readyState"
-                            ) == "complete"
-                        )
-                    except TimeoutException:
-                        time.sleep(wait_time)
-                    break
-        except Exception as e:
-            logger.error(f"Error with button selector {selector}{purpose_str}: {e}")
 
-    if not button_clicked and purpose:
-        logger.warning(f"Could not find button for {purpose}")
+def _locate_eightify_iframe(driver, iframe_selectors):
+    """
+    Resolve the Eightify iframe as {idx, id} with one browser call
 
-    return button_clicked
+    Prefers a raw CDP Runtime.evaluate, which skips the script-injection
+    wrapping execute_script pays per call, and falls back to
+    execute_script when CDP is unavailable (e.g. reattached Remote
+    sessions).
+    """
+    expression = (
+        "((sels) => {" + FIND_EIGHTIFY_IFRAME_JS.replace(
+            "arguments[0]", "sels") + "})(%s)" % json.dumps(
+            list(iframe_selectors))
+    )
+    try:
+        result = driver.execute_cdp_cmd("Runtime.evaluate", {
+            "expression": expression,
+            "returnByValue": True,
+        })
+        return result.get("result", {}).get("value")
+    except Exception:
+        return driver.execute_script(
+            FIND_EIGHTIFY_IFRAME_JS, list(iframe_selectors))
 
 
 def find_iframe_and_switch(driver, iframe_selectors=IFRAME_SELECTORS):
     """
-    Find the Eightify iframe and switch to it
+    Find the Eightify iframe in a single JS pass and switch to it by index
 
     Args:
         driver: WebDriver instance
@@ -293,33 +525,23 @@ def find_iframe_and_switch(driver, iframe_selectors=IFRAME_SELECTORS):
     Returns:
         bool: True if iframe was found and switched to, False otherwise
     """
-    iframe_found = False
-
-    for selector in iframe_selectors:
-        try:
-            iframes = driver.find_elements(By.CSS_SELECTOR, selector)
-            logger.info(f"Found {len(iframes)} iframes with selector: {selector}")
+    try:
+        hit = _locate_eightify_iframe(driver, iframe_selectors)
+    except Exception as selector_error:
+        logger.error(f"Error locating Eightify iframe: {selector_error}")
+        return False
 
-            if iframes:
-                for iframe in iframes:
-                    try:
-                        # Check if this iframe is visible and seems to be
-                        # Eightify
-                        if iframe.is_displayed() and (
-                                iframe.get_attribute("id") == "eightify-iframe" or selector == "iframe"):
-                            logger.info(f"Found potential Eightify iframe! ID: {iframe.get_attribute('id')}")
-                            
-                            # Switch to the iframe
-                            driver.switch_to.frame(iframe)
-                            iframe_found = True
-                            
-                            return True
-                    except Exception as iframe_error:
-                        logger.error(f"Error processing iframe: {iframe_error}")
-        except Exception as selector_error:
-            logger.error(f"Error with iframe selector {selector}: {selector_error}")
+    if not hit:
+        return False
 
-    return False
+    logger.info(f"Found potential Eightify iframe! ID: {hit.get('id')}")
+    try:
+        # Switch to the iframe by document-order index
+        driver.switch_to.frame(hit["idx"])
+        return True
+    except Exception as iframe_error:
+        logger.error(f"Error switching to iframe: {iframe_error}")
+        return False
 
 
 def switch_to_default_content(driver):
@@ -332,9 +554,84 @@ def switch_to_default_content(driver):
         return False
 
 
+@contextlib.contextmanager
+def in_iframe(driver, iframe):
+    """
+    Switch into an iframe for the duration of the block
+
+    Accepts a WebElement or a CSS selector string; always switches back
+    to the default content on exit, including on early returns and
+    exceptions, so callers never need their own default_content cleanup.
+    """
+    if isinstance(iframe, str):
+        iframe = WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, iframe)))
+    driver.switch_to.frame(iframe)
+    try:
+        yield
+    finally:
+        try:
+            driver.switch_to.default_content()
+        except Exception:
+            pass
+
+
+# JavaScript that walks a list of CSS selectors inside the browser and returns
+# the first visible element's text, so Python pays one round-trip instead of
+# one per selector per element
+FIRST_VISIBLE_CONTENT_JS = """
+var sels = arguments[0], min = arguments[1];
+function vis(e) {
+    if (!e.getClientRects().length) return false;
+    var s = window.getComputedStyle(e);
+    return s.display !== 'none' && s.visibility !== 'hidden';
+}
+for (var i = 0; i < sels.length; i++) {
+    var els = document.querySelectorAll(sels[i]);
+    for (var j = 0; j < els.length; j++) {
+        var e = els[j];
+        if (vis(e)) {
+            var t = e.innerText;
+            if (t && t.length > min) return [i, t];
+        }
+    }
+}
+return null;
+"""
+
+
+def first_visible_text(driver, selectors, min_length=MIN_CONTENT_LENGTH):
+    """
+    Query several selectors in one in-browser pass and return the first hit
+
+    The JS filters by visibility and text length, so no per-element
+    is_displayed()/.text round-trips happen over the wire.
+
+    Args:
+        driver: WebDriver instance
+        selectors: Iterable of CSS selectors, in priority order
+        min_length: Minimum text length for a match
+
+    Returns:
+        tuple: (matched selector, text) or None if nothing qualified
+    """
+    selectors = list(selectors)
+    try:
+        hit = driver.execute_script(
+            FIRST_VISIBLE_CONTENT_JS, selectors, min_length)
+    except Exception as query_error:
+        logger.error(f"Error running batched content query: {query_error}")
+        return None
+
+    if hit:
+        selector_index, text = hit
+        return selectors[selector_index], text
+    return None
+
+
 def extract_tab_content(driver, tab_type, content_selectors=CONTENT_SELECTORS):
     """
-    Extract content from the current tab with optimized selector usage
+    Extract content from the current tab with a single batched JS DOM query
 
     Args:
         driver: WebDriver instance
@@ -344,41 +641,15 @@ def extract_tab_content(driver, tab_type, content_selectors=CONTENT_SELECTORS):
     Returns:
         str: Extracted content or empty string if not found
     """
-    # Try high-probability selectors first for faster results
-    high_priority_selectors = content_selectors[:3]  # First 3 selectors are most likely
-    remaining_selectors = content_selectors[3:]
-    
-    # First try the high priority selectors with shorter timeout
-    for content_selector in high_priority_selectors:
-        try:
-            elements = driver.find_elements(By.CSS_SELECTOR, content_selector)
-            for element in elements:
-                if element.is_displayed():
-                    content_text = element.text
-                    if content_text and len(content_text) > MIN_CONTENT_LENGTH:
-                        logger.info(f"Extracted content from {tab_type} tab with selector {content_selector} ({len(content_text)} chars)")
-                        return content_text
-        except Exception as selector_error:
-            logger.error(f"Error with content selector {content_selector}: {selector_error}")
-            continue
-
-    # Try remaining selectors only if high priority ones failed
-    for content_selector in remaining_selectors:
-        try:
-            elements = driver.find_elements(By.CSS_SELECTOR, content_selector)
-            for element in elements:
-                if element.is_displayed():
-                    content_text = element.text
-                    if content_text and len(content_text) > MIN_CONTENT_LENGTH:
-                        logger.info(f"Extracted content from {tab_type} tab with selector {content_selector} ({len(content_text)} chars)")
-                        return content_text
-        except Exception as selector_error:
-            logger.error(f"Error with content selector {content_selector}: {selector_error}")
-            continue
+    hit = first_visible_text(driver, content_selectors)
+    if hit:
+        selector, content_text = hit
+        logger.info(f"Extracted content from {tab_type} tab with selector {selector} ({len(content_text)} chars)")
+        return content_text
 
     # If we still don't have content, try getting the entire body as last resort
     try:
-        body_text = driver.find_element(By.TAG_NAME, "body").text
+        body_text = _body_inner_text(driver)
         if body_text and len(body_text) > MIN_CONTENT_LENGTH:
             logger.info(f"Extracted content from {tab_type} tab using body ({len(body_text)} chars)")
             return body_text
@@ -388,6 +659,28 @@ def extract_tab_content(driver, tab_type, content_selectors=CONTENT_SELECTORS):
     return ""
 
 
+def scroll_and_click(driver, element):
+    """Scroll an element into view and click it in one script round-trip"""
+    driver.execute_script(
+        "arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();",
+        element)
+
+
+def wait_for_content_growth(driver, pre_length, timeout=5, min_growth=MIN_CONTENT_LENGTH):
+    """Wait for the page body text to grow past its pre-click length"""
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            lambda d: d.execute_script(
+                "return document.body ? document.body.innerText.length : 0;")
+            > pre_length + min_growth
+        )
+        return True
+    except TimeoutException:
+        # Content may have rendered before the click; give it a short grace
+        time.sleep(0.5)
+        return False
+
+
 def navigate_to_tab_and_extract(
         driver,
         tab_index,
@@ -406,17 +699,15 @@ def navigate_to_tab_and_extract(
         tab = tabs[tab_index]
         logger.info(f"Processing tab #{tab_index}: {tab_type}")
 
-        # Ensure tab is in view
-        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", tab)
-        time.sleep(0.5)
-        
-        # Click the tab with JavaScript
+        # Scroll into view and click in one script round-trip
         logger.info(f"Clicking tab for: {tab_type}")
-        driver.execute_script("arguments[0].click();", tab)
-        
-        # Wait for content to load
-        time.sleep(2)
-        
+        pre_length = driver.execute_script(
+            "return document.body ? document.body.innerText.length : 0;")
+        scroll_and_click(driver, tab)
+
+        # Wait for content to load instead of sleeping a fixed 2 seconds
+        wait_for_content_growth(driver, pre_length)
+
         # Extract content
         return extract_tab_content(driver, tab_type)
 
@@ -428,15 +719,31 @@ def navigate_to_tab_and_extract(
 def recover_iframe_context(driver, iframe_selector="#eightify-iframe"):
     """Attempt to recover iframe context after errors"""
     try:
-        # First switch back to default content
+        # First switch back to default content; switch_to blocks until
+        # the switch lands, so no settling sleep is needed
         driver.switch_to.default_content()
-        time.sleep(1)  # Brief pause needed here
 
-        # Find the iframe again
-        iframe = driver.find_element(By.CSS_SELECTOR, iframe_selector)
+        # Re-resolve the iframe with one script call instead of a
+        # find_element plus attribute round-trip
+        iframe = driver.execute_script(
+            "return document.querySelector(arguments[0]);", iframe_selector)
+        if iframe is None:
+            logger.error("Eightify iframe no longer present, cannot recover")
+            return False
         driver.switch_to.frame(iframe)
         logger.info("Successfully switched back to iframe context")
         return True
+    except StaleElementReferenceException:
+        # The frame element went stale mid-switch; one clean retry after
+        # re-resolving is all that can help
+        try:
+            driver.switch_to.default_content()
+            iframe = driver.find_element(By.CSS_SELECTOR, iframe_selector)
+            driver.switch_to.frame(iframe)
+            return True
+        except Exception as retry_error:
+            logger.error(f"Failed to recover iframe context: {retry_error}")
+            return False
     except Exception as recovery_error:
         logger.error(f"Failed to recover iframe context: {recovery_error}")
         return False
@@ -457,21 +764,19 @@ def click_summarize_button_in_tab(
 
         tab = tabs[tab_index]
 
-        # Ensure tab is in view
-        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", tab)
-        time.sleep(0.5)
-        
-        # Click the tab with JavaScript
+        # Scroll into view and click in one script round-trip
         logger.info(f"Clicking tab for: {tab_type}")
-        driver.execute_script("arguments[0].click();", tab)
-        
-        # Wait for tab to become active
-        time.sleep(2)
+        pre_length = driver.execute_script(
+            "return document.body ? document.body.innerText.length : 0;")
+        scroll_and_click(driver, tab)
+
+        # Wait for the tab to become active instead of sleeping
+        wait_for_content_growth(driver, pre_length)
 
         # Look for and click "Summarize Video" button
         return find_and_click_button(
             driver,
-            SUMMARIZE_BUTTON_SELECTORS,
+            SUMMARIZE_BUTTON_LOCATORS,
             purpose=f"'Summarize Video' in {tab_type} tab"
         )
     except Exception as tab_error:
@@ -479,10 +784,151 @@ def click_summarize_button_in_tab(
         return False
 
 
-@cache_result
+# Persistent cache of environment probes (Chrome version, extension IDs),
+# keyed by the Chrome binary's mtime so it invalidates on browser updates
+ENV_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "eightify_scraper")
+ENV_CACHE_FILE = os.path.join(ENV_CACHE_DIR, "env.json")
+SESSION_FILE = os.path.join(ENV_CACHE_DIR, "session.json")
+
+# Per-URL result cache: entries expire after a week so stale summaries
+# eventually get re-scraped, and --refresh evicts a URL on demand
+URL_CACHE_DIR = os.path.join(ENV_CACHE_DIR, "url_cache")
+URL_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+_url_cache = None
+
+
+def _get_url_cache():
+    """Open the diskcache-backed URL cache lazily; None when unavailable"""
+    global _url_cache
+    if diskcache is None:
+        return None
+    if _url_cache is None:
+        try:
+            _url_cache = diskcache.Cache(URL_CACHE_DIR)
+        except Exception as cache_error:
+            logger.debug(f"Could not open URL cache: {cache_error}")
+            return None
+    return _url_cache
+
+
+def _url_cache_key(video_url):
+    return hashlib.sha256(video_url.encode("utf-8")).hexdigest()
+
+
+def _persist_session_info(driver):
+    """Record the live session id and executor URL for cheap reattach"""
+    try:
+        os.makedirs(ENV_CACHE_DIR, exist_ok=True)
+        with open(SESSION_FILE, 'w', encoding='utf-8') as f:
+            json.dump({
+                "session_id": driver.session_id,
+                "executor_url": driver.command_executor._url,
+            }, f)
+    except Exception as session_error:
+        logger.debug(f"Could not persist session info: {session_error}")
+
+
+class _ReattachedRemote(webdriver.Remote):
+    """Remote driver that adopts an existing session instead of starting one"""
+
+    def __init__(self, executor_url, session_id):
+        self._reattach_session_id = session_id
+        super().__init__(command_executor=executor_url, options=Options())
+
+    def start_session(self, *args, **kwargs):
+        # Skip the newSession command entirely; just take over the old id
+        self.caps = {}
+        self.session_id = self._reattach_session_id
+
+
+def try_reattach_session():
+    """
+    Reattach to a Chrome session recorded by a previous driver launch
+
+    If chromedriver and the browser are still alive (only the Python side
+    died or dropped its handle), adopting the old session id skips the
+    multi-second cold start of a fresh Chrome.
+
+    Returns:
+        WebDriver instance or None if there is nothing alive to reattach to
+    """
+    try:
+        with open(SESSION_FILE, 'r', encoding='utf-8') as f:
+            info = json.load(f)
+    except Exception:
+        return None
+
+    try:
+        driver = _ReattachedRemote(info["executor_url"], info["session_id"])
+        # Probe the session; a dead one raises and we fall back to relaunch
+        _ = driver.current_url
+        logger.info("Reattached to existing Chrome session")
+        return driver
+    except Exception as reattach_error:
+        logger.debug(f"Could not reattach to previous session: {reattach_error}")
+        try:
+            os.remove(SESSION_FILE)
+        except OSError:
+            pass
+        return None
+
+
+def _chrome_binary_mtime():
+    """Modification time of the Chrome binary, used as the cache key"""
+    chrome_executable = check_chrome_installation()
+    if chrome_executable:
+        try:
+            return os.path.getmtime(chrome_executable)
+        except OSError:
+            pass
+    return None
+
+
+def _load_env_cache():
+    """Read the persistent environment cache, returning {} when absent"""
+    try:
+        with open(ENV_CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def _cached_env_value(key):
+    """Return a cached probe result if the Chrome binary hasn't changed"""
+    cache = _load_env_cache()
+    if cache.get("chrome_mtime") != _chrome_binary_mtime():
+        return None
+    return cache.get(key)
+
+
+def _store_env_value(key, value):
+    """Persist one environment probe result to the on-disk cache"""
+    cache = _load_env_cache()
+    cache["chrome_mtime"] = _chrome_binary_mtime()
+    cache[key] = value
+    try:
+        os.makedirs(ENV_CACHE_DIR, exist_ok=True)
+        # Write through a temp file so concurrent runs never read a
+        # half-written cache
+        fd, tmp_path = tempfile.mkstemp(dir=ENV_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, ENV_CACHE_FILE)
+    except Exception as cache_error:
+        logger.debug(f"Could not write environment cache: {cache_error}")
+
+
+@functools.lru_cache(maxsize=1)
 def get_chrome_version():
     """Get the version of Chrome installed on the system"""
-    system = platform.system()
+    cached = _cached_env_value("chrome_version")
+    if cached:
+        return cached
+
+    version = None
+    system = SYSTEM
     try:
         if system == "Windows":
             # Try to get chrome version from the registry
@@ -491,35 +937,55 @@ def get_chrome_version():
                 winreg.HKEY_CURRENT_USER,
                 r"Software\Google\Chrome\BLBeacon")
             version, _ = winreg.QueryValueEx(key, "version")
-            return version
         elif system == "Darwin":  # macOS
-            process = subprocess.Popen(
-                ['/Applications/Google Chrome.app/Contents/MacOS/Google Chrome', '--version'],
-                stdout=subprocess.PIPE
-            )
-            version = process.communicate()[0].decode(
-                'UTF-8').replace('Google Chrome', '').strip()
-            return version
+            # Fast path: the version sits in the app bundle's Info.plist,
+            # so a file read beats forking Chrome just to print it
+            try:
+                with open('/Applications/Google Chrome.app/Contents/Info.plist',
+                          'r', encoding='utf-8', errors='ignore') as f:
+                    match = re.search(
+                        r'<key>CFBundleShortVersionString</key>\s*'
+                        r'<string>([\d.]+)</string>', f.read())
+                if match:
+                    version = match.group(1)
+            except OSError:
+                pass
+            if not version:
+                result = subprocess.run(
+                    ['/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+                     '--version'],
+                    capture_output=True, timeout=2)
+                version = result.stdout.decode(
+                    'UTF-8').replace('Google Chrome', '').strip()
         elif system == "Linux":
-            process = subprocess.Popen(
-                ['google-chrome', '--version'],
-                stdout=subprocess.PIPE
-            )
-            version = process.communicate()[0].decode(
-                'UTF-8').replace('Google Chrome', '').strip()
-            return version
+            # Fast path: Chrome ships its version as a plain text file
+            try:
+                with open('/opt/google/chrome/product_version',
+                          encoding='utf-8') as f:
+                    version = f.read().strip()
+            except OSError:
+                pass
+            if not version:
+                result = subprocess.run(
+                    ['google-chrome', '--version'],
+                    capture_output=True, timeout=2)
+                version = result.stdout.decode(
+                    'UTF-8').replace('Google Chrome', '').strip()
     except Exception as e:
         logger.error(f"Could not determine Chrome version: {e}")
 
-    return None
+    if version:
+        _store_env_value("chrome_version", version)
 
+    return version
 
-@cache_result
+
+@functools.lru_cache(maxsize=1)
 def get_eightify_extension_id():
     """
     Try to find the Eightify extension ID in the user's Chrome profile
     """
-    system = platform.system()
+    system = SYSTEM
 
     try:
         # Determine user data directory based on OS
@@ -548,151 +1014,207 @@ def get_eightify_extension_id():
             extensions_path = os.path.join(
                 user_data_dir, 'Default', 'Extensions')
 
+        # Serve from the on-disk cache while the Extensions directory is
+        # unchanged; installs and updates bump its mtime
+        try:
+            extensions_mtime = os.path.getmtime(extensions_path)
+        except OSError:
+            extensions_mtime = None
+        cached = _cached_env_value("eightify_extensions")
+        if (cached is not None and
+                _cached_env_value("eightify_extensions_mtime") == extensions_mtime):
+            return cached
+
         # Look for extension folders that might be Eightify
         eightify_dirs = []
         if os.path.exists(extensions_path):
-            for ext_id in os.listdir(extensions_path):
-                # Look for manifest.json files in each extension directory
-                for version in os.listdir(
-                    os.path.join(
-                        extensions_path,
-                        ext_id)):
+            with os.scandir(extensions_path) as ext_entries:
+                for ext_entry in ext_entries:
+                    if not ext_entry.is_dir():
+                        continue
+
+                    # Only look at the newest version directory of each
+                    # extension instead of parsing every installed version
+                    with os.scandir(ext_entry.path) as version_entries:
+                        version_dirs = [v.name for v in version_entries
+                                        if v.is_dir()]
+                    if not version_dirs:
+                        continue
                     manifest_path = os.path.join(
-                        extensions_path, ext_id, version, 'manifest.json')
-                    if os.path.exists(manifest_path):
-                        try:
-                            with open(manifest_path, 'r', encoding='utf-8') as f:
-                                manifest_data = json.load(f)
-                                # Check if this could be Eightify based on name
-                                # or description
-                                name = manifest_data.get('name', '').lower()
-                                description = manifest_data.get(
-                                    'description', '').lower()
-
-                                # Look for keywords that suggest it's Eightify
-                                eightify_keywords = [
-                                    'eightify',
-                                    'eight',
-                                    'transcript',
-                                    'summary',
-                                    'youtube transcript',
-                                    'summarize']
-
-                                if (any(keyword in name for keyword in eightify_keywords) or any(
-                                        keyword in description for keyword in eightify_keywords)):
-                                    eightify_dirs.append(ext_id)
-                                    logger.info(f"Found potential Eightify extension: {ext_id} - {name}")
-                        except Exception:
-                            # Skip if there's any issue reading the manifest
-                            pass
+                        ext_entry.path, max(version_dirs), 'manifest.json')
+
+                    # name/description sit at the top of a manifest, so a
+                    # 2 KB head read catches the keywords without pulling
+                    # in 100KB+ of i18n strings; most manifests fail the
+                    # scan and never get read fully or JSON-parsed
+                    try:
+                        with open(manifest_path, 'rb') as f:
+                            head = f.read(2048)
+                            if not _EIGHTIFY_KEYWORD_RE.search(head):
+                                continue
+                            manifest_bytes = head + f.read()
+                    except OSError:
+                        continue
+
+                    try:
+                        manifest_data = json.loads(manifest_bytes)
+                    except Exception:
+                        # Skip if there's any issue reading the manifest
+                        continue
 
+                    # Check if this could be Eightify based on name
+                    # or description
+                    name = manifest_data.get('name', '').lower()
+                    description = manifest_data.get(
+                        'description', '').lower()
+
+                    if (any(keyword in name for keyword in EIGHTIFY_KEYWORDS) or any(
+                            keyword in description for keyword in EIGHTIFY_KEYWORDS)):
+                        eightify_dirs.append(ext_entry.name)
+                        logger.info(f"Found potential Eightify extension: {ext_entry.name} - {name}")
+                        # One whitelist ID is all downstream needs; stop
+                        # scanning the rest of the extensions tree
+                        break
+
+        _store_env_value("eightify_extensions", eightify_dirs)
+        _store_env_value("eightify_extensions_mtime", extensions_mtime)
         return eightify_dirs
     except Exception as e:
         logger.error(f"Error finding Eightify extension ID: {e}")
         return []
 
 
+def retry_with_refresh(driver, check, max_retries=3, refresh_wait=5, label="condition"):
+    """
+    Run a readiness check, refreshing the page between failed attempts
+
+    Args:
+        driver: WebDriver instance
+        check: Callable taking the driver; returns True when ready and may
+            raise TimeoutException to signal a failed attempt
+        max_retries: Total number of attempts
+        refresh_wait: Ceiling in seconds on the post-refresh load wait
+        label: Description of the condition for log messages
+
+    Returns:
+        bool: True once the check passes, False if every attempt failed
+    """
+    for attempt in range(max_retries):
+        try:
+            if check(driver):
+                return True
+            failure = "not met"
+        except TimeoutException:
+            failure = "timed out"
+
+        if attempt < max_retries - 1:
+            logger.warning(
+                f"{label} {failure} (attempt {attempt + 1}/{max_retries}), refreshing...")
+            driver.refresh()
+            # Wait for the reload to actually settle instead of a fixed
+            # pause; fast reloads return in well under a second
+            try:
+                WebDriverWait(driver, refresh_wait).until(
+                    lambda d: d.execute_script(
+                        "return document.readyState") == "complete")
+            except TimeoutException:
+                pass
+
+    return False
+
+
 def scrape_eightify_data(youtube_url, close_existing=False):
     """
     Scrape all data produced by Eightify extension for a YouTube video
+
+    Returns:
+        tuple: (WebDriver instance or None, extracted data dict). The
+        driver is handed back explicitly so callers own its lifetime;
+        nothing is captured through module-level patching.
     """
     # Initialize the Chrome driver
     driver, error = initialize_chrome_driver(close_existing)
 
     if not driver:
         error["video_url"] = youtube_url
-        return error
+        return None, error
 
     try:
         # Modify URL to force start from beginning (t=0)
-        if '?' in youtube_url:
-            if 't=' in youtube_url:
-                # Replace existing time parameter
-                youtube_url = re.sub(r't=\d+', 't=0', youtube_url)
-            else:
-                # Add time parameter
-                youtube_url += '&t=0'
-        else:
-            # No parameters yet
-            youtube_url += '?t=0'
+        youtube_url, replaced = _T_PARAM_RE.subn(r'\g<1>t=0', youtube_url)
+        if not replaced:
+            youtube_url += ('&' if '?' in youtube_url else '?') + 't=0'
             
         logger.info(f"Using URL with time reset: {youtube_url}")
         
         # Navigate to the YouTube video
         logger.info(f"Navigating to {youtube_url}")
         driver.get(youtube_url)
-        
-        # Simple wait instead of human-like behavior
-        time.sleep(2)
+
+        # Wait for the document to leave the loading state rather than
+        # sleeping a fixed 2 seconds; the movie_player wait below does the
+        # heavier readiness check
+        try:
+            WebDriverWait(driver, 5, poll_frequency=0.1).until(
+                lambda d: d.execute_script(
+                    "return document.readyState") != "loading"
+            )
+        except TimeoutException:
+            pass
 
         # Wait for the video to load with retries for the "Something went wrong" error
         logger.info("Waiting for video player to load...")
-        video_loaded = False
-        retry_count = 0
-        max_retries = 3
-        
-        while not video_loaded and retry_count < max_retries:
-            try:
-                # Wait for movie_player element
-                WebDriverWait(driver, WAIT_TIME_LOAD).until(
-                    EC.presence_of_element_located((By.ID, "movie_player"))
-                )
-                
-                # Check if error message is present
-                error_messages = driver.find_elements(By.XPATH, "//div[contains(text(), 'Something went wrong')]")
-                if error_messages and len(error_messages) > 0 and error_messages[0].is_displayed():
-                    logger.warning(f"YouTube error detected (attempt {retry_count+1}/{max_retries}), refreshing...")
-                    driver.refresh()
-                    time.sleep(5)  # Wait after refresh
-                    retry_count += 1
-                    continue
-                
-                # Make sure video is playing from beginning by directly setting time to 0
-                try:
-                    driver.execute_script("document.querySelector('video').currentTime = 0;")
-                    logger.info("Reset video position to beginning")
-                except Exception as time_error:
-                    logger.warning(f"Could not reset video time: {time_error}")
-                
-                video_loaded = True
-                logger.info("Video loaded successfully")
-                
-            except TimeoutException:
-                if retry_count < max_retries - 1:
-                    logger.warning(f"Timed out waiting for video player (attempt {retry_count+1}/{max_retries}), refreshing...")
-                    driver.refresh()
-                    time.sleep(5)  # Wait after refresh
-                    retry_count += 1
-                else:
-                    logger.warning("Final timeout waiting for video player, trying to continue anyway")
-                    video_loaded = True  # Force continue on last attempt
 
-        # Give Eightify time to load
+        def video_player_ready(d):
+            # Wait for movie_player element with a tight poll interval
+            WebDriverWait(d, WAIT_TIME_LOAD, poll_frequency=0.1).until(
+                EC.presence_of_element_located((By.ID, "movie_player"))
+            )
+
+            # Fail the attempt if the "Something went wrong" error is
+            # showing; one JS call covers both the lookup and the
+            # visibility check instead of find_elements + is_displayed
+            return not d.execute_script(
+                "for (const div of document.querySelectorAll('div')) {"
+                "  if (div.textContent.includes('Something went wrong') &&"
+                "      div.getClientRects().length) return true;"
+                "}"
+                "return false;")
+
+        if retry_with_refresh(driver, video_player_ready, max_retries=3,
+                              label="Video player"):
+            # Make sure video is playing from beginning by directly setting time to 0
+            try:
+                driver.execute_script("document.querySelector('video').currentTime = 0;")
+                logger.info("Reset video position to beginning")
+            except Exception as time_error:
+                logger.warning(f"Could not reset video time: {time_error}")
+            logger.info("Video loaded successfully")
+        else:
+            logger.warning("Final timeout waiting for video player, trying to continue anyway")
+
+        # Give Eightify time to load, matching all candidate selectors in
+        # one combined CSS query per poll and refreshing once if it never shows
         logger.info("Waiting for Eightify to load...")
-        try:
-            # Try to wait for Eightify iframe to appear
-            WebDriverWait(driver, WAIT_TIME_EXTENSION).until(
-                lambda d: any(len(d.find_elements(By.CSS_SELECTOR, sel)) > 0 for sel in IFRAME_SELECTORS[:3])
+
+        def eightify_present(d):
+            WebDriverWait(d, WAIT_TIME_EXTENSION, poll_frequency=0.1).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, EIGHTIFY_IFRAME_CSS))
             )
-            
-        except TimeoutException:
-            # If timeout, use sleep as fallback
-            time.sleep(WAIT_TIME_EXTENSION)
-            
-            # Try refreshing once more if Eightify doesn't appear
-            if not any(len(driver.find_elements(By.CSS_SELECTOR, sel)) > 0 for sel in IFRAME_SELECTORS[:3]):
-                logger.warning("Eightify not detected, trying page refresh...")
-                driver.refresh()
-                time.sleep(WAIT_TIME_EXTENSION)
+            return True
 
-        return process_eightify_content(driver, youtube_url)
+        if not retry_with_refresh(driver, eightify_present, max_retries=2,
+                                  refresh_wait=WAIT_TIME_EXTENSION, label="Eightify iframe"):
+            logger.warning("Eightify not detected after refresh, continuing anyway")
+
+        return driver, process_eightify_content(driver, youtube_url)
 
     except Exception as e:
         logger.error(f"Error during navigation: {str(e)}")
         if driver:
             logger.info("Driver still active - browser control handed to main function")
 
-        return {
+        return driver, {
             "video_url": youtube_url,
             "status": "Error",
             "message": f"Error during navigation: {str(e)}"
@@ -712,7 +1234,6 @@ def process_eightify_content(driver, youtube_url):
     """
     try:
         logger.info("Looking for Eightify iframe...")
-        iframe_found = False
         eightify_data = {
             "key_insights": "",
             "timestamped_summary": "",
@@ -720,47 +1241,36 @@ def process_eightify_content(driver, youtube_url):
             "transcript": ""
         }
 
-        # Try each iframe selector until we find a match
-        for selector in IFRAME_SELECTORS:
-            iframes = driver.find_elements(By.CSS_SELECTOR, selector)
-            logger.info(f"Found {len(iframes)} iframes with selector: {selector}")
-
-            if not iframes:
-                continue
-
-            for iframe in iframes:
-                try:
-                    # Check if this iframe is visible and seems to be Eightify
-                    if not (iframe.is_displayed() and (iframe.get_attribute(
-                            "id") == "eightify-iframe" or selector == "iframe")):
-                        continue
-
-                    logger.info(f"Found potential Eightify iframe! ID: {iframe.get_attribute('id')}")
-
-                    # Process the iframe
-                    iframe_data = process_iframe(driver, iframe)
-
-                    # Merge with existing data
-                    for key, value in iframe_data.items():
-                        if value and (
-                                key not in eightify_data or not eightify_data[key]):
-                            eightify_data[key] = value
+        # Locate the iframe with one batched JS pass instead of a
+        # find_elements + is_displayed + get_attribute round-trip per
+        # selector per candidate
+        hit = None
+        got_any = False
+        try:
+            hit = _locate_eightify_iframe(driver, IFRAME_SELECTORS)
+        except Exception as selector_error:
+            logger.error(f"Error locating Eightify iframe: {selector_error}")
 
-                    iframe_found = True
-                    break
-                except Exception as iframe_error:
-                    logger.error(f"Error processing iframe: {iframe_error}")
-                    driver.switch_to.default_content()  # Make sure we're back to the main content
-
-            # If we've found some data, we can break the selector loop
-            if iframe_found and any(
-                value for key,
-                value in eightify_data.items() if key in [
-                    "key_insights",
-                    "timestamped_summary",
-                    "top_comments",
-                    "transcript"]):
-                break
+        if hit is not None:
+            logger.info(f"Found potential Eightify iframe! ID: {hit.get('id')}")
+            try:
+                # Resolve the element by document-order index with a
+                # single find_elements call
+                iframe = driver.find_elements(
+                    By.TAG_NAME, "iframe")[hit["idx"]]
+
+                # Process the iframe
+                iframe_data = process_iframe(driver, iframe)
+
+                # Merge with existing data
+                for key, value in iframe_data.items():
+                    if value and (
+                            key not in eightify_data or not eightify_data[key]):
+                        eightify_data[key] = value
+                        got_any = True
+            except Exception as iframe_error:
+                logger.error(f"Error processing iframe: {iframe_error}")
+                driver.switch_to.default_content()  # Make sure we're back to the main content
 
         # Process transcript data if we found it
         structured_transcript = []
@@ -771,7 +1281,7 @@ def process_eightify_content(driver, youtube_url):
         # Prepare the final result
         result = {
             "video_url": youtube_url,
-            "status": "Success" if any(eightify_data.values()) else "Error",
+            "status": "Success" if got_any else "Error",
             "key_insights": eightify_data.get("key_insights", ""),
             "timestamped_summary": eightify_data.get("timestamped_summary", ""),
             "top_comments": eightify_data.get("top_comments", ""),
@@ -824,60 +1334,199 @@ def process_iframe(driver, iframe):
     tab_data = {}
 
     try:
-        # Switch to the iframe
-        driver.switch_to.frame(iframe)
-
-        # Check if there's already content present first - early return if content exists
-        content_present = check_for_existing_content(driver)
-        if content_present:
-            # If content is already present, extract directly without clicking buttons
-            logger.info("Content found - extracting without clicking buttons")
-            tab_data = extract_content_from_tabs(driver)
-            if any(tab_data.values()):
-                driver.switch_to.default_content()
-                return tab_data
-                
-        # First, try to click the main summarize button if needed
-        main_button_clicked = find_and_click_button_optimized(
-            driver,
-            SUMMARIZE_BUTTON_SELECTORS,
-            purpose="main summarize button",
-            wait_time=WAIT_TIME_PROCESSING
-        )
+        # The context manager switches back to the main document on every
+        # exit path, so the early return and the error path need no
+        # default_content bookkeeping of their own
+        with in_iframe(driver, iframe):
+            # Check if there's already content present first - early return if content exists
+            content_present = check_for_existing_content(driver)
+            if content_present:
+                # If content is already present, snapshot every panel in one JS
+                # round-trip and only click through tabs still missing content
+                logger.info("Content found - extracting without clicking buttons")
+                tab_data = snapshot_tab_panels(driver)
+                missing_tabs = [tab for tab in TAB_TYPES if not tab_data.get(tab)]
+                if missing_tabs:
+                    clicked_data = extract_content_from_tabs(driver)
+                    for tab in missing_tabs:
+                        if clicked_data.get(tab):
+                            tab_data[tab] = clicked_data[tab]
+                if any(tab_data.values()):
+                    return tab_data
+
+            # First, try to click the main summarize button if needed
+            main_button_clicked = find_and_click_button(
+                driver,
+                SUMMARIZE_BUTTON_LOCATORS,
+                purpose="main summarize button",
+                wait_time=WAIT_TIME_PROCESSING
+            )
 
-        if main_button_clicked:
-            logger.info("Successfully clicked main summarize button. Now checking for tabs.")
+            if main_button_clicked:
+                logger.info("Successfully clicked main summarize button. Now checking for tabs.")
 
-        # Extract content from tabs
-        tab_data = extract_content_from_tabs(driver)
+            # Sweep all tabs with one in-page async script; fall back to the
+            # driver-based tab walk only for tabs the sweep could not produce
+            tab_data = collect_tab_contents_async(driver)
+            missing_tabs = [tab for tab in TAB_TYPES if not tab_data.get(tab)]
 
-        # If we're still missing some tabs, try a direct extraction approach
-        missing_tabs = [tab for tab in TAB_TYPES if not tab_data.get(tab)]
+            if missing_tabs:
+                clicked_data = extract_content_from_tabs(driver)
+                for tab in missing_tabs:
+                    if clicked_data.get(tab):
+                        tab_data[tab] = clicked_data[tab]
 
-        if missing_tabs:
-            tab_data = extract_direct_content(driver, tab_data, missing_tabs)
+            # If we're still missing some tabs, try a direct extraction approach
+            missing_tabs = [tab for tab in TAB_TYPES if not tab_data.get(tab)]
 
-        # Switch back to main content
-        driver.switch_to.default_content()
+            if missing_tabs:
+                tab_data = extract_direct_content(driver, tab_data, missing_tabs)
     except Exception as e:
         logger.error(f"Error processing iframe content: {e}")
-        driver.switch_to.default_content()
+
+    return tab_data
+
+
+# JavaScript that snapshots every rendered tab panel's text in one
+# round-trip, keyed by tab name. Eightify usually keeps all four panels
+# in the DOM (the tabs just toggle display), so no per-tab clicking is
+# needed when they exist. Panels are resolved against one selector at a
+# time (never a union) and keep their document position even when empty,
+# so a short or blank panel can never shift later panels onto the wrong
+# tab name; nested wrapper matches are dropped the same way
+SNAPSHOT_TAB_PANELS_JS = """
+var names = arguments[0], min = arguments[1];
+var sels = [
+    "[class*='SummaryTabsView_panel']",
+    "[role='tabpanel']",
+    ".SummaryTabsView_content__6OYs8"
+];
+var panels = [];
+for (var s = 0; s < sels.length && panels.length === 0; s++) {
+    panels = Array.prototype.slice.call(document.querySelectorAll(sels[s]));
+}
+panels = panels.filter(function (p) {
+    return !panels.some(function (q) { return q !== p && p.contains(q); });
+});
+var out = {};
+for (var i = 0; i < names.length && i < panels.length; i++) {
+    var t = panels[i].innerText;
+    if (t && t.length > min) out[names[i]] = t;
+}
+return out;
+"""
+
+
+def snapshot_tab_panels(driver):
+    """
+    Grab the text of every rendered tab panel in a single JS call
+
+    Returns:
+        dict: tab_type -> text for panels already present in the DOM
+    """
+    try:
+        tab_data = driver.execute_script(
+            SNAPSHOT_TAB_PANELS_JS, list(TAB_TYPES), MIN_CONTENT_LENGTH) or {}
+    except Exception as snapshot_error:
+        logger.error(f"Error snapshotting tab panels: {snapshot_error}")
+        return {}
+
+    if tab_data:
+        logger.info(f"Snapshotted {len(tab_data)} tab panels in one pass")
+
+    return tab_data
+
+
+# Async JavaScript that clicks through every Eightify tab and polls for
+# each panel's text entirely inside the browser, so a whole tab sweep is
+# one execute_async_script call instead of O(tabs) Python round-trips
+COLLECT_TAB_CONTENTS_JS = """
+var tabSel = arguments[0], contentSel = arguments[1];
+var names = arguments[2], min = arguments[3], perTabMs = arguments[4];
+var done = arguments[arguments.length - 1];
+(async function () {
+    var readVisible = function () {
+        var els = document.querySelectorAll(contentSel);
+        for (var j = 0; j < els.length; j++) {
+            if (els[j].offsetParent !== null) {
+                var t = els[j].innerText;
+                if (t && t.length > min) { return t; }
+            }
+        }
+        return '';
+    };
+    // Resolve as soon as the panel mutates into readiness instead of
+    // sampling on a fixed tick; the timeout is only the upper bound
+    var waitForContent = function (timeoutMs) {
+        return new Promise(function (resolve) {
+            var initial = readVisible();
+            if (initial) { resolve(initial); return; }
+            var observer = new MutationObserver(function () {
+                var t = readVisible();
+                if (t) {
+                    observer.disconnect();
+                    clearTimeout(timer);
+                    resolve(t);
+                }
+            });
+            var timer = setTimeout(function () {
+                observer.disconnect();
+                resolve(readVisible());
+            }, timeoutMs);
+            observer.observe(document.body, {
+                childList: true, subtree: true, characterData: true
+            });
+        });
+    };
+    var results = {};
+    var tabs = document.querySelectorAll(tabSel);
+    var n = Math.min(tabs.length, names.length);
+    for (var i = 0; i < n; i++) {
+        try {
+            tabs[i].scrollIntoView({block: 'center'});
+            tabs[i].click();
+            var text = await waitForContent(perTabMs);
+            if (text) results[names[i]] = text;
+        } catch (e) {}
+    }
+    done(results);
+})();
+"""
+
+
+def collect_tab_contents_async(driver):
+    """
+    Click through every Eightify tab inside the browser in one async call
+
+    All the tab clicks, per-panel waits and content reads happen in-page,
+    so the whole sweep costs a single WebDriver command instead of several
+    round-trips per tab.
+
+    Returns:
+        dict: tab_type -> text for every tab whose panel rendered in time
+    """
+    per_tab_ms = WAIT_TIME_TAB_CONTENT * 1000
+    try:
+        driver.set_script_timeout(len(TAB_TYPES) * (WAIT_TIME_TAB_CONTENT + 2))
+        results = driver.execute_async_script(
+            COLLECT_TAB_CONTENTS_JS, TAB_SELECTORS, CONTENT_CSS_UNION,
+            list(TAB_TYPES), MIN_CONTENT_LENGTH, per_tab_ms)
+    except Exception as collect_error:
+        logger.error(f"Error collecting tab contents in-page: {collect_error}")
+        return {}
+
+    tab_data = {tab: text for tab, text in (results or {}).items() if text}
+    if tab_data:
+        logger.info(f"Collected {len(tab_data)} tabs with one in-page sweep")
 
     return tab_data
 
 
 def check_for_existing_content(driver):
     """Check if content is already present in the iframe"""
-    try:
-        content_selectors = [".SummaryTabsView_content__6OYs8", "[class*='content']", ".tab-content"]
-        for selector in content_selectors:
-            elements = driver.find_elements(By.CSS_SELECTOR, selector)
-            for element in elements:
-                if element.is_displayed() and len(element.text.strip()) > MIN_CONTENT_LENGTH:
-                    logger.info("Content already present, no need to click the summarize button")
-                    return True
-    except Exception as e:
-        logger.error(f"Error checking for existing content: {e}")
+    if first_visible_text(driver, [EXISTING_CONTENT_CSS]):
+        logger.info("Content already present, no need to click the summarize button")
+        return True
 
     return False
 
@@ -887,10 +1536,15 @@ def extract_content_from_tabs(driver):
     tab_data = {}
 
     try:
-        # Wait 5 seconds after page loads before starting tab processing
-        logger.info("Waiting 5 seconds for initial page stabilization...")
-        time.sleep(5)
-        
+        # Wait for the tab strip to render instead of a fixed 5s pause
+        logger.info("Waiting for Eightify tabs to appear...")
+        try:
+            WebDriverWait(driver, WAIT_TIME_TAB_CONTENT, poll_frequency=0.1).until(
+                EC.presence_of_all_elements_located((By.CSS_SELECTOR, TAB_SELECTORS))
+            )
+        except TimeoutException:
+            logger.warning("Timed out waiting for Eightify tabs to appear")
+
         # Find the tabs
         tabs = driver.find_elements(By.CSS_SELECTOR, TAB_SELECTORS)
 
@@ -904,100 +1558,60 @@ def extract_content_from_tabs(driver):
         # Only process tabs that exist (don't try more tabs than found)
         actual_tab_types = TAB_TYPES[:min(tab_count, len(TAB_TYPES))]
 
-        # Process each tab sequentially from start to finish
-        logger.info("Processing tabs sequentially one by one")
+        # Phase A (submit): click every tab and its Summarize button
+        # back-to-back without waiting in between, so all of the
+        # summaries generate concurrently on Eightify's side instead of
+        # serializing behind per-tab waits
+        logger.info("Submitting summarize requests for all tabs")
         for i, tab_type in enumerate(actual_tab_types):
-            if i >= tab_count:
-                break
-            
-            logger.info(f"PROCESSING TAB {i+1}/{len(actual_tab_types)}: {tab_type}")
-            
-            # Get the tab element (re-find each time to avoid stale references)
-            tabs = driver.find_elements(By.CSS_SELECTOR, TAB_SELECTORS)
             if i >= len(tabs):
                 logger.warning(f"Tab {i} for {tab_type} not found, skipping")
                 continue
-                
+
             tab = tabs[i]
-            
-            # First ensure tab is in view
-            logger.info(f"Scrolling to tab: {tab_type}")
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", tab)
-            time.sleep(0.5)  # Wait for scrolling to complete
-            
-            # Click the tab
-            logger.info(f"Clicking tab: {tab_type}")
             try:
-                driver.execute_script("arguments[0].click();", tab)
+                try:
+                    scroll_and_click(driver, tab)
+                except StaleElementReferenceException:
+                    logger.info(f"Tab handle for {tab_type} went stale, re-finding tabs")
+                    tabs = driver.find_elements(By.CSS_SELECTOR, TAB_SELECTORS)
+                    if i >= len(tabs):
+                        logger.warning(f"Tab {i} for {tab_type} disappeared, skipping")
+                        continue
+                    tab = tabs[i]
+                    scroll_and_click(driver, tab)
             except Exception as tab_click_error:
                 logger.error(f"Error clicking tab {tab_type}: {tab_click_error}")
                 continue
-                
-            # Wait initially for tab to become active
-            time.sleep(2)
-            
-            # Look for and click "Summarize Video" button if present
-            summarize_clicked = False
-            for btn_selector in SUMMARIZE_BUTTON_SELECTORS:
-                if summarize_clicked:
-                    break
-                    
-                try:
-                    if btn_selector.startswith("//"):
-                        # XPath selector
-                        buttons = driver.find_elements(By.XPATH, btn_selector)
-                    else:
-                        # CSS selector
-                        buttons = driver.find_elements(By.CSS_SELECTOR, btn_selector)
-                        
-                    for button in buttons:
-                        if button.is_displayed():
-                            logger.info(f"Found 'Summarize Video' button in {tab_type} tab")
-                            driver.execute_script("arguments[0].click();", button)
-                            summarize_clicked = True
-                            logger.info(f"Clicked 'Summarize Video' button in {tab_type} tab")
-                            break
-                except Exception as btn_error:
-                    logger.error(f"Error with button selector {btn_selector} in {tab_type} tab: {btn_error}")
-            
-            # Wait for content to be generated (3 seconds as requested)
-            logger.info(f"Waiting 5 seconds for {tab_type} content to generate...")
-            time.sleep(5)
-            
-            # Extract content
-            content_found = False
-            for content_selector in CONTENT_SELECTORS:
-                if content_found:
-                    break
-                    
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, content_selector)
-                    for element in elements:
-                        if element.is_displayed():
-                            content_text = element.text.strip()
-                            if content_text and len(content_text) > MIN_CONTENT_LENGTH:
-                                tab_data[tab_type] = content_text
-                                logger.info(f"Extracted content from {tab_type} tab ({len(content_text)} chars)")
-                                content_found = True
-                                break
-                except Exception as selector_error:
-                    logger.error(f"Error with content selector {content_selector}: {selector_error}")
-                    continue
-            
-            # If we still don't have content, try getting the entire body
-            if not content_found:
-                try:
-                    body_text = driver.find_element(By.TAG_NAME, "body").text.strip()
-                    if body_text and len(body_text) > MIN_CONTENT_LENGTH:
-                        tab_data[tab_type] = body_text
-                        logger.info(f"Extracted content from {tab_type} tab using body text ({len(body_text)} chars)")
-                        content_found = True
-                except Exception as body_error:
-                    logger.error(f"Error getting body text: {body_error}")
-            
-            # Add a separator in logs between tabs
-            logger.info(f"Completed processing tab: {tab_type} - {'SUCCESS' if content_found else 'FAILED'}")
-            logger.info("-" * 40)
+
+            # Click "Summarize Video" if this tab shows one, with one
+            # in-browser scan instead of per-selector round-trips
+            try:
+                matched = driver.execute_script(
+                    CLICK_FIRST_VISIBLE_JS, list(SUMMARIZE_SELECTOR_STRINGS))
+                if matched:
+                    logger.info(f"Clicked 'Summarize Video' button in {tab_type} tab (selector: {matched})")
+                else:
+                    label = driver.execute_script(CLICK_SUMMARIZE_BY_TEXT_JS)
+                    if label:
+                        logger.info(f"Clicked summarize button in {tab_type} tab by text match: {label}")
+            except Exception as btn_error:
+                logger.error(f"Error scanning summarize buttons in {tab_type} tab: {btn_error}")
+
+        # Phase B (reap): one in-page sweep revisits each tab and
+        # resolves as soon as its panel renders; because every summary
+        # was already requested above, the per-tab waits overlap the
+        # server-side generation instead of adding to it
+        logger.info("Collecting generated tab contents")
+        tab_data = collect_tab_contents_async(driver)
+
+        # Anything still missing gets one last batched snapshot (panels
+        # occasionally render while the sweep is on a later tab)
+        missing = [tab for tab in actual_tab_types if not tab_data.get(tab)]
+        if missing:
+            for tab, text in snapshot_tab_panels(driver).items():
+                if tab in missing and text:
+                    tab_data[tab] = text
 
     except Exception as e:
         logger.error(f"Error extracting content from tabs: {e}")
@@ -1025,77 +1639,62 @@ def extract_direct_content(driver, tab_data, missing_tabs):
     logger.info("Trying direct extraction approach...")
 
     try:
-        # First check if we're still in the iframe context
+        # One script call replaces the old three probes (html reachable,
+        # body present, body text); it throwing means the iframe context
+        # was lost and needs to be recovered
+        def read_body_text():
+            return _body_inner_text(driver) or None
+
         try:
-            # Quick check to see if we're in iframe context
-            test_element = driver.find_element(By.TAG_NAME, "html")
-            is_in_iframe = True
+            all_content = read_body_text()
         except Exception:
-            is_in_iframe = False
             logger.warning("No longer in iframe context, attempting to recover...")
-        
-        # If we lost iframe context, try to recover it
-        if not is_in_iframe:
-            logger.info("Attempting to find the iframe again...")
             driver.switch_to.default_content()
-            time.sleep(1)
-            
+
             # Try to find the iframe again
-            iframe_found = find_iframe_and_switch(driver)
-            if not iframe_found:
+            if not find_iframe_and_switch(driver):
                 logger.error("Failed to recover iframe context, aborting direct extraction")
                 return tab_data
-        
-        # Verify we can access the body before proceeding
-        try:
-            # Check if body exists
-            body_present = EC.presence_of_element_located((By.TAG_NAME, "body"))
-            if not body_present(driver):
-                logger.error("Body element not found in iframe, cannot extract content directly")
-                return tab_data
-        except Exception as verify_error:
-            logger.error(f"Error verifying body presence: {verify_error}")
-            return tab_data
-            
-        # Now try to get all text content from the iframe
-        try:
-            all_content = driver.find_element(By.TAG_NAME, "body").text
-            if not all_content or len(all_content.strip()) < MIN_CONTENT_LENGTH:
-                logger.warning("Body element found but contains insufficient content")
+
+            try:
+                all_content = read_body_text()
+            except Exception as body_error:
+                logger.error(f"Error extracting body text: {body_error}")
                 return tab_data
-        except Exception as body_error:
-            logger.error(f"Error extracting body text: {body_error}")
+
+        if not all_content or len(all_content.strip()) < MIN_CONTENT_LENGTH:
+            logger.warning("Body element found but contains insufficient content")
             return tab_data
-            
+
         logger.info(f"Successfully extracted body text ({len(all_content)} chars)")
 
-        # Try to segment the content by looking for section headers
-        for tab in missing_tabs:
-            for header in CONTENT_SECTION_HEADERS[tab]:
-                if header in all_content:
-                    # Find the section and extract it
-                    start_idx = all_content.find(header)
-                    if start_idx == -1:
-                        continue
+        # Find every section header in a single compiled-regex pass and
+        # group the hits by tab, so each missing tab is a dict lookup
+        # instead of another scan over the match list
+        matches = [(m.start(), m.group(1))
+                   for m in SECTION_HEADER_RE.finditer(all_content)]
+        tab_match_indices = {}
+        for idx, (_, header) in enumerate(matches):
+            header_tab = HEADER_TO_TAB_TYPE.get(header.casefold())
+            if header_tab is not None:
+                tab_match_indices.setdefault(header_tab, []).append(idx)
 
-                    # Find the next section header or use the end of text
+        for tab in missing_tabs:
+            for idx in tab_match_indices.get(tab, ()):
+                # Slice up to the next section header or the end of text
+                start_idx = matches[idx][0]
+                if idx + 1 < len(matches):
+                    end_idx = matches[idx + 1][0]
+                else:
                     end_idx = len(all_content)
 
-                    # Look for the next section header
-                    all_headers = sum(CONTENT_SECTION_HEADERS.values(), [])
-                    for next_header in all_headers:
-                        next_start = all_content.find(
-                            next_header, start_idx + len(header))
-                        if next_start != -1 and next_start < end_idx:
-                            end_idx = next_start
-
-                    # Extract the section content
-                    section_content = all_content[start_idx:end_idx].strip()
-                    if len(section_content) > MIN_CONTENT_LENGTH:
-                        tab_data[tab] = section_content
-                        logger.info(f"Extracted {tab} content through direct extraction ({len(section_content)} chars)")
-                        break
-                        
+                # Extract the section content
+                section_content = all_content[start_idx:end_idx].strip()
+                if len(section_content) > MIN_CONTENT_LENGTH:
+                    tab_data[tab] = section_content
+                    logger.info(f"Extracted {tab} content through direct extraction ({len(section_content)} chars)")
+                    break
+
     except Exception as e:
         logger.error(f"Error in direct extraction: {e}")
         # Make sure we return to default content in case of error
@@ -1109,10 +1708,44 @@ def extract_direct_content(driver, tab_data, missing_tabs):
         driver.switch_to.default_content()
     except:
         pass
-        
+
     return tab_data
 
 
+def iter_structured_transcript(transcript_text):
+    """
+    Yield timestamp/text dictionaries from raw transcript text
+
+    A generator so stream-oriented consumers (incremental serialization,
+    filtering) never hold the whole structured list alongside the source
+    text; finditer itself walks the string without splitting it into a
+    line list.
+
+    Args:
+        transcript_text: Raw transcript text
+
+    Yields:
+        dict: {"timestamp": str, "text": str} per transcript entry
+    """
+    # One compiled-regex pass over the whole text keeps the hot loop in
+    # the C regex engine and preserves line order
+    for match in _TRANSCRIPT_LINE_RE.finditer(transcript_text):
+        timestamp = match.group('timestamp')
+        if timestamp is not None:
+            yield {
+                "timestamp": timestamp,
+                "text": match.group('text').strip()
+            }
+        else:
+            # If not a timestamp, keep the text unless it is UI chrome
+            line = match.group('plain').strip()
+            if line.lower() not in _SKIP_LINES:
+                yield {
+                    "timestamp": "",
+                    "text": line
+                }
+
+
 def process_transcript_data(transcript_text):
     """
     Process transcript text into structured format
@@ -1125,49 +1758,77 @@ def process_transcript_data(transcript_text):
     """
     logger.info("Processing transcript text...")
     logger.info(f"First 100 characters: {transcript_text[:100]}...")
-    transcript_lines = transcript_text.split('\n')
-    structured_transcript = []
-
-    i = 0
-    while i < len(transcript_lines):
-        # Check if the current line matches a timestamp pattern
-        current_line = transcript_lines[i].strip()
-        is_timestamp = (
-            ':' in current_line and
-            len(current_line) <= 8 and
-            all(c.isdigit() or c == ':' for c in current_line)
-        )
+    return list(iter_structured_transcript(transcript_text))
 
-        if is_timestamp and i + 1 < len(transcript_lines):
-            timestamp = current_line
-            text = transcript_lines[i + 1].strip()
-            structured_transcript.append({
-                "timestamp": timestamp,
-                "text": text
-            })
-            i += 2
-        else:
-            # If not a timestamp, just add the text
-            if current_line and not current_line.lower() == "transcript":
-                structured_transcript.append({
-                    "timestamp": "",
-                    "text": current_line
-                })
-            i += 1
 
-    return structured_transcript
+# Last time close_existing_chrome actually swept processes; sweeps are
+# syscall-heavy (taskkill/pkill or a psutil walk) and pointless when one
+# just ran, e.g. launch retries a few seconds apart
+_last_chrome_kill_ts = 0.0
+_CHROME_KILL_COOLDOWN = 60
 
 
 def close_existing_chrome(system):
     """Attempt to close any existing Chrome instances to avoid profile conflicts"""
+    global _last_chrome_kill_ts
+    if time.monotonic() - _last_chrome_kill_ts < _CHROME_KILL_COOLDOWN:
+        logger.debug("Skipping Chrome cleanup; a sweep ran recently")
+        return
+    _last_chrome_kill_ts = time.monotonic()
+
+    if psutil is not None:
+        try:
+            chrome_procs = [
+                proc for proc in psutil.process_iter(['name'])
+                if proc.info['name'] and 'chrome' in proc.info['name'].lower()
+            ]
+            for proc in chrome_procs:
+                try:
+                    proc.terminate()
+                except psutil.NoSuchProcess:
+                    pass
+
+            # Wait only as long as the processes need; force-kill stragglers
+            _, alive = psutil.wait_procs(chrome_procs, timeout=3)
+            for proc in alive:
+                try:
+                    proc.kill()
+                except psutil.NoSuchProcess:
+                    pass
+
+            logger.info(f"Closed {len(chrome_procs)} existing Chrome processes")
+            return
+        except Exception as e:
+            logger.warning(f"psutil Chrome cleanup failed ({e}), falling back to shell kill")
+
     try:
+        # List-argv subprocess.run skips the shell launch os.system paid;
+        # CREATE_NO_WINDOW stops taskkill flashing a console on Windows
         if system == "Windows":
-            os.system("taskkill /f /im chrome.exe > nul 2>&1")
+            subprocess.run(
+                ["taskkill", "/f", "/im", "chrome.exe"],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                creationflags=0x08000000)  # CREATE_NO_WINDOW
         elif system in ["Darwin", "Linux"]:
-            os.system("pkill -f chrome > /dev/null 2>&1")
+            subprocess.run(
+                ["pkill", "-f", "chrome"],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
         logger.info("Attempted to close existing Chrome instances")
-        time.sleep(2)  # Give time for Chrome to fully close
+
+        # Poll for the processes to disappear instead of a fixed 2 s
+        # sleep; Chrome is usually gone well under a second
+        if system in ["Darwin", "Linux"]:
+            deadline = time.monotonic() + 2
+            while time.monotonic() < deadline:
+                probe = subprocess.run(
+                    ["pgrep", "-f", "chrome"],
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                if probe.returncode != 0:
+                    break
+                time.sleep(0.1)
+        else:
+            time.sleep(0.5)
     except Exception:
         logger.warning("Failed to close Chrome, but continuing anyway")
 
@@ -1177,20 +1838,32 @@ def save_eightify_data_to_file(eightify_data, output_file):
     # Create a clean data structure with the video URL as the key
     clean_data = {
         eightify_data.get("video_url", ""): {
-            "key_insights": eightify_data.get("key_insights", ""),
-            "timestamped_summary": eightify_data.get("timestamped_summary", ""),
-            "top_comments": eightify_data.get("top_comments", ""),
-            "transcript": eightify_data.get("transcript", "")
+            key: eightify_data.get(key, "") for key in RESULT_KEYS
         }
     }
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(clean_data, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if PRETTY_JSON else 0
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(clean_data, option=option))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(clean_data, f, indent=_JSON_INDENT,
+                      separators=_JSON_SEPARATORS, ensure_ascii=False)
     logger.info(f"Eightify data saved to {output_file}")
 
 
+# Fast path for the overwhelmingly common watch?v=... form; the full
+# urlparse fallback below handles youtu.be and /embed/ URLs
+_VIDEO_ID_RE = re.compile(r'[?&]v=([A-Za-z0-9_-]{11})')
+
+
 def extract_video_id(video_url):
     """Extract the YouTube video ID from a URL"""
+    match = _VIDEO_ID_RE.search(video_url)
+    if match:
+        return match.group(1)
+
     try:
         from urllib.parse import urlparse, parse_qs
 
@@ -1237,13 +1910,14 @@ def process_next_url(driver, video_url):
         # Give Eightify time to load
         logger.info("Waiting for Eightify to load...")
         try:
-            # Try to wait for Eightify iframe to appear
-            WebDriverWait(driver, WAIT_TIME_EXTENSION).until(
-                lambda d: any(len(d.find_elements(By.CSS_SELECTOR, sel)) > 0 for sel in IFRAME_SELECTORS[:3])
+            # Try to wait for the Eightify iframe, matching all candidate
+            # selectors with one combined CSS query per poll instead of a
+            # find_elements round-trip per selector
+            WebDriverWait(driver, WAIT_TIME_EXTENSION, poll_frequency=0.1).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, EIGHTIFY_IFRAME_CSS))
             )
         except TimeoutException:
-            # If timeout, use sleep as fallback
-            time.sleep(WAIT_TIME_EXTENSION)
+            logger.warning("Eightify iframe not detected, trying to continue anyway")
 
         # Use the existing functions to extract content
         return process_eightify_content(driver, video_url)
@@ -1267,15 +1941,26 @@ def download_chromedriver_manually(chrome_version=None):
     Returns:
         str: Path to the chromedriver executable or None if download fails
     """
+    # Imported here: the manual download path runs at most once per
+    # environment, so the rest of the program never pays for these
+    import zipfile
+
+    import requests
+    from requests.adapters import HTTPAdapter
+
     try:
         if not chrome_version:
             chrome_version = get_chrome_version()
 
+        # One Session keeps the TLS connection alive across the version
+        # lookup and the zip download instead of handshaking per request
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(max_retries=3))
+
         if not chrome_version:
             logger.warning("Could not determine Chrome version, using latest ChromeDriver")
             chrome_driver_url = "https://chromedriver.storage.googleapis.com/LATEST_RELEASE"
-            with urllib.request.urlopen(chrome_driver_url) as response:
-                version = response.read().decode('utf-8').strip()
+            version = session.get(chrome_driver_url, timeout=30).text.strip()
         else:
             # Extract major version (e.g., "94.0.4606.81" -> "94")
             major_version = chrome_version.split('.')[0]
@@ -1284,19 +1969,19 @@ def download_chromedriver_manually(chrome_version=None):
             # Get the latest ChromeDriver version for this Chrome version
             chrome_driver_url = f"https://chromedriver.storage.googleapis.com/LATEST_RELEASE_{major_version}"
             try:
-                with urllib.request.urlopen(chrome_driver_url) as response:
-                    version = response.read().decode('utf-8').strip()
+                response = session.get(chrome_driver_url, timeout=30)
+                response.raise_for_status()
+                version = response.text.strip()
             except Exception as e:
                 logger.error(f"Error getting driver for version {major_version}: {e}")
                 # Fallback to latest version
                 chrome_driver_url = "https://chromedriver.storage.googleapis.com/LATEST_RELEASE"
-                with urllib.request.urlopen(chrome_driver_url) as response:
-                    version = response.read().decode('utf-8').strip()
+                version = session.get(chrome_driver_url, timeout=30).text.strip()
 
         logger.info(f"Downloading ChromeDriver version: {version}")
 
         # Determine platform
-        system = platform.system()
+        system = SYSTEM
         if system == "Windows":
             platform_name = "win32"
         elif system == "Darwin":  # macOS
@@ -1319,17 +2004,30 @@ def download_chromedriver_manually(chrome_version=None):
             "chromedriver_temp")
         os.makedirs(driver_dir, exist_ok=True)
 
-        zip_file_path = os.path.join(driver_dir, "chromedriver.zip")
-        driver_path = os.path.join(
-            driver_dir,
-            "chromedriver.exe" if system == "Windows" else "chromedriver")
-
-        # Download zip file
-        urllib.request.urlretrieve(download_url, zip_file_path)
-
-        # Extract zip file
-        with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
-            zip_ref.extractall(driver_dir)
+        driver_name = "chromedriver.exe" if system == "Windows" else "chromedriver"
+        driver_path = os.path.join(driver_dir, driver_name)
+
+        # Unzip straight from memory: the archive is a few MB, so holding
+        # it in a BytesIO skips the write-zip-then-reread disk round-trip
+        # (and leaves no stale chromedriver.zip behind). Streaming off the
+        # reused connection fills the buffer in 64 KB chunks
+        zip_buffer = io.BytesIO()
+        with session.get(download_url, stream=True, timeout=120) as response:
+            response.raise_for_status()
+            shutil.copyfileobj(response.raw, zip_buffer)
+        session.close()
+
+        # Extract only the driver binary; the archive also carries license
+        # and notice files (and newer releases nest a directory) we never use
+        with zipfile.ZipFile(zip_buffer) as zip_ref:
+            member = next(
+                (name for name in zip_ref.namelist()
+                 if os.path.basename(name) == driver_name), None)
+            if member is None:
+                logger.error(f"{driver_name} not found in downloaded archive")
+                return None
+            with zip_ref.open(member) as src, open(driver_path, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
 
         # Make chromedriver executable on Linux/Mac
         if system != "Windows":
@@ -1344,6 +2042,22 @@ def download_chromedriver_manually(chrome_version=None):
         return None
 
 
+# Cached result of check_chrome_installation; None is a valid (negative)
+# result, so a separate flag records whether the check has run
+_chrome_executable = None
+_chrome_executable_checked = False
+
+
+def clear_platform_cache():
+    """Forget cached platform probes (Chrome/driver paths, versions)"""
+    global _chrome_executable, _chrome_executable_checked
+    _chrome_executable = None
+    _chrome_executable_checked = False
+    get_chrome_version.cache_clear()
+    find_existing_chromedriver.cache_clear()
+    get_eightify_extension_id.cache_clear()
+
+
 def check_chrome_installation():
     """
     Check if Chrome browser is properly installed and accessible
@@ -1351,7 +2065,11 @@ def check_chrome_installation():
     Returns:
         str: Path to Chrome executable or None if not found
     """
-    system = platform.system()
+    global _chrome_executable, _chrome_executable_checked
+    if _chrome_executable_checked:
+        return _chrome_executable
+
+    system = SYSTEM
     chrome_executable = None
 
     if system == "Windows":
@@ -1365,34 +2083,29 @@ def check_chrome_installation():
                     ''),
                 "Google\\Chrome\\Application\\chrome.exe")]
 
-        for path in possible_paths:
-            if os.path.exists(path):
-                chrome_executable = path
-                break
+        chrome_executable = next(
+            (path for path in possible_paths if os.path.exists(path)), None)
     elif system == "Darwin":  # macOS
         if os.path.exists(
                 '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'):
             chrome_executable = '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'
     else:  # Linux
-        # Try to locate chrome using 'which'
-        try:
-            chrome_executable = subprocess.check_output(
-                ['which', 'google-chrome']).decode('utf-8').strip()
-        except subprocess.SubprocessError:
-            try:
-                chrome_executable = subprocess.check_output(
-                    ['which', 'chrome']).decode('utf-8').strip()
-            except subprocess.SubprocessError:
-                pass
+        # shutil.which does the PATH walk in-process, no fork needed
+        chrome_executable = (shutil.which('google-chrome')
+                             or shutil.which('chrome'))
 
-    if chrome_executable and os.path.exists(chrome_executable):
+    if not (chrome_executable and os.path.exists(chrome_executable)):
+        logger.warning("Warning: Chrome browser not found in common locations")
+        chrome_executable = None
+    else:
         logger.info(f"Found Chrome browser at: {chrome_executable}")
-        return chrome_executable
 
-    logger.warning("Warning: Chrome browser not found in common locations")
-    return None
+    _chrome_executable = chrome_executable
+    _chrome_executable_checked = True
+    return chrome_executable
 
 
+@functools.lru_cache(maxsize=1)
 def find_existing_chromedriver():
     """
     Find existing ChromeDriver in the system PATH
@@ -1400,7 +2113,21 @@ def find_existing_chromedriver():
     Returns:
         str: Path to chromedriver executable or None if not found
     """
-    system = platform.system()
+    # Warm runs resolve straight from the on-disk cache, skipping the
+    # PATH walk entirely as long as the recorded binary still exists
+    cached = _cached_env_value("chromedriver_path")
+    if cached and os.path.exists(cached):
+        return cached
+
+    driver_path = _scan_for_chromedriver()
+    if driver_path:
+        _store_env_value("chromedriver_path", driver_path)
+    return driver_path
+
+
+def _scan_for_chromedriver():
+    """Walk the current directory, PATH and common locations for a driver"""
+    system = SYSTEM
     driver_executable = "chromedriver.exe" if system == "Windows" else "chromedriver"
 
     # Check in current directory first
@@ -1412,12 +2139,11 @@ def find_existing_chromedriver():
         logger.info(f"Found ChromeDriver in current directory: {current_dir_driver}")
         return current_dir_driver
 
-    # Check in PATH
-    for path_dir in os.environ.get('PATH', '').split(os.pathsep):
-        driver_path = os.path.join(path_dir, driver_executable)
-        if os.path.exists(driver_path):
-            logger.info(f"Found ChromeDriver in PATH: {driver_path}")
-            return driver_path
+    # Check in PATH (in-process, no fork)
+    driver_path = shutil.which(driver_executable)
+    if driver_path:
+        logger.info(f"Found ChromeDriver in PATH: {driver_path}")
+        return driver_path
 
     # On Windows, check in Program Files and other common locations
     if system == "Windows":
@@ -1426,26 +2152,32 @@ def find_existing_chromedriver():
             "C:\\Program Files (x86)\\Google\\Chrome\\Application\\chromedriver.exe",
             os.path.join(os.environ.get('LOCALAPPDATA', ''),
                          "Google\\Chrome\\Application\\chromedriver.exe"),
-            # ChromeDriver might be in webdriver-manager cache
-            os.path.join(
-                os.environ.get(
-                    'LOCALAPPDATA',
-                    ''),
-                ".wdm\\drivers\\chromedriver\\win32\\*\\chromedriver.exe")
         ]
 
         for path in possible_paths:
-            if '*' in path:  # Handle glob pattern
-                matching_files = glob.glob(path)
-                if matching_files:
-                    # Sort by modified time to get the most recent one
-                    newest_driver = max(matching_files, key=os.path.getmtime)
-                    logger.info(f"Found ChromeDriver using glob pattern: {newest_driver}")
-                    return newest_driver
-            elif os.path.exists(path):
+            if os.path.exists(path):
                 logger.info(f"Found ChromeDriver in common location: {path}")
                 return path
 
+        # webdriver-manager cache: one scandir over the version dirs,
+        # with each entry stat'd exactly once to pick the newest driver
+        wdm_dir = os.path.join(os.environ.get('LOCALAPPDATA', ''),
+                               ".wdm", "drivers", "chromedriver", "win32")
+        try:
+            with os.scandir(wdm_dir) as it:
+                version_dirs = [e for e in it if e.is_dir()]
+        except OSError:
+            version_dirs = []
+        candidates = []
+        for entry in version_dirs:
+            candidate = os.path.join(entry.path, "chromedriver.exe")
+            if os.path.exists(candidate):
+                candidates.append((entry.stat().st_mtime, candidate))
+        if candidates:
+            newest_driver = max(candidates)[1]
+            logger.info(f"Found ChromeDriver in webdriver-manager cache: {newest_driver}")
+            return newest_driver
+
     logger.warning("Could not find existing ChromeDriver")
     return None
 
@@ -1467,7 +2199,7 @@ def is_chromedriver_compatible(driver_path):
             return False
 
         # Get ChromeDriver version
-        system = platform.system()
+        system = SYSTEM
         cmd = f'"{driver_path}" --version'
 
         result = subprocess.run(
@@ -1504,57 +2236,144 @@ def is_chromedriver_compatible(driver_path):
         return False
 
 
-def setup_chrome_options(system):
+# Static Chrome arguments shared by every launch. Hoisted to a tuple so
+# _build_options just iterates instead of rebuilding the same list (and
+# re-deciding the same comments) on each call; dynamic values such as the
+# profile directory, window size, user agent and extension IDs are
+# appended separately.
+_CHROME_STATIC_ARGS = (
+    "--profile-directory=Default",  # Use default profile
+    # Essential: Anti-detection measures
+    "--disable-blink-features=AutomationControlled",
+    # Skip first-run dialogs and background chatter that slow startup
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-sync",
+    "--disable-background-networking",
+    "--disable-dev-shm-usage",  # Overcome limited resource problems
+    # Disable notifications to avoid interference
+    "--disable-notifications",
+    # Skip per-site process isolation so iframe access stays cheap
+    "--disable-features=IsolateOrigins,site-per-process",
+    # Defense-in-depth behind the CDP URL blocking: never decode images
+    # at all (the scraper only ever reads text)
+    "--blink-settings=imagesEnabled=false",
+    # Disable logging for cleaner output
+    "--log-level=3",  # Only show fatal errors
+)
+
+# Keep the Chrome disk cache on tmpfs where available so warm page
+# loads and V8's code cache (keyed on the cache dir) hit RAM instead of
+# thrashing the profile disk; capped at 512 MB
+if SYSTEM == "Linux" and os.path.isdir("/dev/shm"):
+    _CHROME_CACHE_DIR = "/dev/shm/eightify_cache"
+else:
+    _CHROME_CACHE_DIR = os.path.join(tempfile.gettempdir(), "eightify_cache")
+
+_CHROME_STATIC_ARGS += (
+    f"--disk-cache-dir={_CHROME_CACHE_DIR}",
+    "--disk-cache-size=536870912",
+)
+
+# Extra arguments for unattended/server runs with EIGHTIFY_HEADLESS=1.
+# GPU stays enabled: the new headless implementation works with it and
+# disabling it forces the slower software rasterizer
+_CHROME_HEADLESS_ARGS = (
+    "--headless=new",
+)
+
+
+def _worker_profile_dir(base_user_data_dir, worker_slot):
     """
-    Set up Chrome options for Eightify extension with optimized stealth settings
+    Per-worker copy of the profile pieces Chrome locks per instance
+
+    Chrome refuses to share a user-data-dir between processes, so pool
+    workers each get a slim clone (extensions plus preferences, not the
+    whole multi-GB profile) under the scraper cache directory. The clone
+    is made once and reused on later runs.
+    """
+    worker_dir = os.path.join(
+        ENV_CACHE_DIR, "profiles", f"worker-{worker_slot}")
+    if os.path.exists(worker_dir):
+        return worker_dir
+
+    logger.info(f"Cloning Chrome profile for worker {worker_slot}...")
+    os.makedirs(os.path.join(worker_dir, "Default"), exist_ok=True)
+
+    local_state = os.path.join(base_user_data_dir, "Local State")
+    if os.path.isfile(local_state):
+        try:
+            shutil.copy2(local_state, os.path.join(worker_dir, "Local State"))
+        except Exception as copy_error:
+            logger.warning(f"Could not clone Local State: {copy_error}")
+
+    for rel in ("Extensions", "Local Extension Settings",
+                "Preferences", "Secure Preferences"):
+        src = os.path.join(base_user_data_dir, "Default", rel)
+        dst = os.path.join(worker_dir, "Default", rel)
+        try:
+            if os.path.isdir(src):
+                shutil.copytree(src, dst)
+            elif os.path.isfile(src):
+                shutil.copy2(src, dst)
+        except Exception as copy_error:
+            logger.warning(f"Could not clone profile entry {rel}: {copy_error}")
+
+    return worker_dir
+
+
+def _build_options(user_data_dir, eightify_extensions, worker_slot=None):
+    """
+    Assemble a fresh Options object from the cached argument tuples
 
     Args:
-        system: Operating system platform
+        user_data_dir: Chrome profile directory to load
+        eightify_extensions: Extension IDs to whitelist (may be empty)
+        worker_slot: Pool worker index for a distinct debugging port,
+            or None for a standalone browser
 
     Returns:
-        tuple: (Options object, user_data_dir)
+        Options: Configured Chrome options
     """
     chrome_options = Options()
 
-    # Determine user data directory based on OS
-    if system == "Windows":
-        user_data_dir = os.path.join(
-            os.environ['USERPROFILE'],
-            'AppData',
-            'Local',
-            'Google',
-            'Chrome',
-            'User Data')
-    elif system == "Darwin":  # macOS
-        user_data_dir = os.path.join(
-            os.environ['HOME'],
-            'Library',
-            'Application Support',
-            'Google',
-            'Chrome')
-    else:  # Linux
-        user_data_dir = os.path.join(
-            os.environ['HOME'], '.config', 'google-chrome')
-
-    logger.info(f"Using Chrome profile directory: {user_data_dir}")
+    # Return from driver.get as soon as the DOM is ready instead of
+    # waiting for every image/font/tracker subresource; the waits on
+    # #movie_player and the Eightify iframe cover actual readiness
+    chrome_options.page_load_strategy = "eager"
 
     # Essential: Use existing profile with the extension
     chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
-    chrome_options.add_argument("--profile-directory=Default")  # Use default profile
+
+    for arg in _CHROME_STATIC_ARGS:
+        chrome_options.add_argument(arg)
+
+    # Distinct DevTools port per pool worker so parallel Chromes don't
+    # collide on the default
+    if worker_slot is not None:
+        chrome_options.add_argument(
+            f"--remote-debugging-port={9222 + worker_slot}")
 
     # Set random window size to appear more human-like
     width = random.randint(1280, 1920)
     height = random.randint(800, 1080)
     chrome_options.add_argument(f"--window-size={width},{height}")
 
-    # Essential: Anti-detection measures
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    # Optional headless mode for unattended/server runs. Off by default:
+    # extensions only work with the new headless implementation and the
+    # visible browser is still the safest bet against detection
+    if os.environ.get("EIGHTIFY_HEADLESS") == "1":
+        logger.info("Running Chrome headless (EIGHTIFY_HEADLESS=1)")
+        for arg in _CHROME_HEADLESS_ARGS:
+            chrome_options.add_argument(arg)
+
+    # One merged excludeSwitches list: a second add_experimental_option
+    # call with the same key overwrites rather than merges, which was
+    # silently dropping enable-automation
+    chrome_options.add_experimental_option(
+        "excludeSwitches", ["enable-automation", "enable-logging"])
     chrome_options.add_experimental_option("useAutomationExtension", False)
 
-    # Get the Eightify extension ID if possible
-    eightify_extensions = get_eightify_extension_id()
-
     # Enable specific extensions if we found them
     if eightify_extensions:
         logger.info(f"Found potential Eightify extensions: {eightify_extensions}")
@@ -1564,73 +2383,428 @@ def setup_chrome_options(system):
     else:
         logger.warning("Could not find Eightify extension ID. Will use all extensions in profile.")
 
-    # Essential stability options
-    chrome_options.add_argument("--no-sandbox")  # Required for some environments
-    chrome_options.add_argument("--disable-dev-shm-usage")  # Overcome limited resource problems
-
-    # Disable notifications to avoid interference
-    chrome_options.add_argument("--disable-notifications")
-
     # Set a random user agent
     random_user_agent = random.choice(USER_AGENTS)
     chrome_options.add_argument(f"--user-agent={random_user_agent}")
     logger.debug(f"Using user agent: {random_user_agent}")
 
-    # Disable logging for cleaner output
-    chrome_options.add_argument("--log-level=3")  # Only show fatal errors
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-logging"])
-
-    return chrome_options, user_data_dir
+    return chrome_options
 
 
-def initialize_chrome_driver(close_existing=False):
+def setup_chrome_options(system, worker_slot=None):
     """
-    Initialize Chrome WebDriver with stealth settings
+    Set up Chrome options for Eightify extension with optimized stealth settings
 
     Args:
-        close_existing: Whether to close existing Chrome instances
+        system: Operating system platform
+        worker_slot: Pool worker index, or None for a standalone browser
 
     Returns:
-        tuple: (WebDriver instance, error message if failed)
+        tuple: (Options object, user_data_dir)
     """
-    # Get system info
-    system = platform.system()
-    logger.info(f"Operating System: {system}")
-    chrome_version = get_chrome_version()
-    logger.info(f"Chrome Version: {chrome_version}")
+    # Determine user data directory based on OS
+    if system == "Windows":
+        user_data_dir = os.path.join(
+            os.environ['USERPROFILE'],
+            'AppData',
+            'Local',
+            'Google',
+            'Chrome',
+            'User Data')
+    elif system == "Darwin":  # macOS
+        user_data_dir = os.path.join(
+            os.environ['HOME'],
+            'Library',
+            'Application Support',
+            'Google',
+            'Chrome')
+    else:  # Linux
+        user_data_dir = os.path.join(
+            os.environ['HOME'], '.config', 'google-chrome')
+
+    # Get the Eightify extension ID if possible (from the real profile,
+    # before any per-worker redirection)
+    eightify_extensions = get_eightify_extension_id()
+
+    # Pool workers point at their own slim profile clone so multiple
+    # Chromes can run side by side
+    if worker_slot is not None:
+        user_data_dir = _worker_profile_dir(user_data_dir, worker_slot)
+
+    logger.info(f"Using Chrome profile directory: {user_data_dir}")
+
+    chrome_options = _build_options(
+        user_data_dir, eightify_extensions, worker_slot)
+
+    return chrome_options, user_data_dir
+
+
+def _launch_with_default(chrome_options):
+    """Let Selenium Manager / PATH resolve the driver"""
+    return webdriver.Chrome(options=chrome_options)
+
+
+def _launch_with_existing_driver(chrome_options):
+    """Launch with a locally found, version-compatible chromedriver"""
+    driver_path = find_existing_chromedriver()
+    if not driver_path or not is_chromedriver_compatible(driver_path):
+        raise RuntimeError("No compatible local ChromeDriver found")
+    return webdriver.Chrome(
+        service=Service(driver_path), options=chrome_options)
+
+
+def _launch_with_manager(chrome_options):
+    """Launch with a driver installed by webdriver-manager"""
+    # install() re-checks versions over the network on every call, so the
+    # resolved path is kept in the env cache (invalidated, like the rest
+    # of it, when the Chrome binary changes)
+    driver_path = _cached_env_value("manager_driver_path")
+    if not driver_path or not os.path.exists(driver_path):
+        from webdriver_manager.chrome import ChromeDriverManager
+        driver_path = ChromeDriverManager().install()
+        _store_env_value("manager_driver_path", driver_path)
+    return webdriver.Chrome(
+        service=Service(driver_path), options=chrome_options)
+
+
+def _launch_with_manual_download(chrome_options):
+    """Launch with a driver downloaded straight from the Chrome CDN"""
+    driver_path = download_chromedriver_manually(get_chrome_version())
+    if not driver_path:
+        raise RuntimeError("Manual ChromeDriver download failed")
+    return webdriver.Chrome(
+        service=Service(driver_path), options=chrome_options)
+
+
+# Launch strategies in default preference order. The name of the last
+# strategy that worked is persisted in the env cache, so later runs on a
+# host where e.g. only the manual download works dispatch straight to it
+# instead of re-paying every failed attempt first.
+_LAUNCH_STRATEGIES = {
+    "default": _launch_with_default,
+    "existing_driver": _launch_with_existing_driver,
+    "manager": _launch_with_manager,
+    "manual_download": _launch_with_manual_download,
+}
+
+_LAUNCH_ORDER = ("default", "existing_driver", "manager", "manual_download")
+
+
+def _resolve_launch_strategies():
+    """Strategy names to try, with the cached winner moved to the front"""
+    strategies = list(_LAUNCH_ORDER)
+    cached = _cached_env_value("launch_strategy")
+    if cached in _LAUNCH_STRATEGIES:
+        strategies.remove(cached)
+        strategies.insert(0, cached)
+    return strategies
+
+
+def initialize_chrome_driver(close_existing=False, worker_slot=None):
+    """
+    Initialize Chrome WebDriver with stealth settings
+
+    Args:
+        close_existing: Whether to close existing Chrome instances
+        worker_slot: Pool worker index, or None for a standalone browser.
+            Workers get their own profile copy and debugging port so
+            several Chromes can run without fighting over the profile lock
+
+    Returns:
+        tuple: (WebDriver instance, error message if failed)
+    """
+    # Get system info
+    system = SYSTEM
+    logger.info(f"Operating System: {system}")
+    chrome_version = get_chrome_version()
+    logger.info(f"Chrome Version: {chrome_version}")
 
     # Set up Chrome options
-    chrome_options, user_data_dir = setup_chrome_options(system)
+    chrome_options, user_data_dir = setup_chrome_options(system, worker_slot)
 
     # Automatically download appropriate ChromeDriver version
     logger.info("Setting up ChromeDriver...")
-    driver = None
 
-    try:
-        # Try with basic Chrome initialization first
-        logger.info("Attempting basic Chrome initialization with user profile...")
-        if close_existing:
-            close_existing_chrome(system)
-        driver = webdriver.Chrome(options=chrome_options)
-        
+    if close_existing:
+        close_existing_chrome(system)
+
+    cached_strategy = _cached_env_value("launch_strategy")
+    for strategy_name in _resolve_launch_strategies():
+        try:
+            logger.info(f"Launching Chrome via strategy: {strategy_name}")
+            driver = _LAUNCH_STRATEGIES[strategy_name](chrome_options)
+        except Exception as e:
+            logger.error(f"Launch strategy {strategy_name} failed: {e}")
+            continue
+
+        # Remember what worked so the next run dispatches directly
+        if strategy_name != cached_strategy:
+            _store_env_value("launch_strategy", strategy_name)
+
         # Apply stealth settings
         apply_stealth_settings(driver)
-        
-        return driver, None
 
-    except Exception as e:
-        logger.error(f"Error initializing with user profile: {e}")
-        
-        # Remaining fallback approaches unchanged
-        # ... (keep the rest of the initialization code)
+        # Starve the page of video/image/analytics bytes we never read
+        apply_network_blocking(driver)
+
+        # Let overlapping Selenium commands use parallel connections
+        _enlarge_connection_pool(driver)
+
+        # Remember the session so a later run/retry can reattach cheaply
+        _persist_session_info(driver)
+
+        return driver, None
 
-    # Should never reach here, but just in case:
     return None, {
         "status": "Error",
         "message": "Failed to initialize browser"
     }
 
 
+class EightifyDriverPool:
+    """
+    Pool of pre-warmed Chrome instances with the Eightify extension loaded
+
+    Batch runs draw browsers from the pool instead of paying the
+    multi-second Chrome launch and extension load for every URL. Released
+    drivers are reset (cookies cleared, parked on about:blank) rather than
+    quit and relaunched, and each instance is retired after
+    MAX_USES_PER_INSTANCE scrapes so leaked renderer memory from long
+    YouTube sessions cannot accumulate forever.
+    """
+
+    MAX_USES_PER_INSTANCE = 50
+
+    def __init__(self, size=4):
+        self.size = size
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._uses = {}
+        # Slot ids are recycled through a free set rather than a counter:
+        # each slot owns a profile clone and a debug port, so a retired
+        # driver must hand back its own id, not shrink a high-water mark
+        # that still belongs to a running browser
+        self._free_slots = set(range(size))
+        self._slots = {}
+        atexit.register(self.shutdown)
+
+    def warm_up(self):
+        """Launch all of the pool's browsers up front"""
+        while True:
+            with self._lock:
+                if not self._free_slots:
+                    break
+                slot = min(self._free_slots)
+                self._free_slots.remove(slot)
+
+            driver, error = initialize_chrome_driver(worker_slot=slot)
+            if not driver:
+                with self._lock:
+                    self._free_slots.add(slot)
+                logger.error(f"Failed to warm up pooled browser: {error}")
+                break
+            self._slots[driver] = slot
+            self._idle.put(driver)
+
+    @contextlib.contextmanager
+    def acquire(self, timeout=None):
+        """Borrow a driver from the pool for the duration of a with-block"""
+        driver = self._acquire(timeout)
+        try:
+            yield driver
+        except Exception:
+            # The scrape failed; don't trust the browser state for reuse
+            self.release(driver, reuse=False)
+            raise
+        else:
+            self.release(driver)
+
+    def _acquire(self, timeout=None):
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if self._is_alive(driver):
+                return driver
+            # The browser died while parked (crash, OOM kill, manual
+            # close); drop it and fall through to launch a replacement
+            self._discard(driver)
+
+        # Launch a new browser if the pool is under capacity
+        with self._lock:
+            under_capacity = bool(self._free_slots)
+            if under_capacity:
+                slot = min(self._free_slots)
+                self._free_slots.remove(slot)
+
+        if under_capacity:
+            driver, error = initialize_chrome_driver(worker_slot=slot)
+            if driver:
+                self._slots[driver] = slot
+                return driver
+            with self._lock:
+                self._free_slots.add(slot)
+            raise RuntimeError(f"Could not launch pooled browser: {error}")
+
+        # At capacity: wait for another worker to release a driver
+        driver = self._idle.get(timeout=timeout)
+        if self._is_alive(driver):
+            return driver
+        self._discard(driver)
+        return self._acquire(timeout)
+
+    def _is_alive(self, driver):
+        """Cheap liveness probe for a parked driver before handing it out"""
+        try:
+            if not driver.service.is_connectable():
+                return False
+            _ = driver.window_handles
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, driver):
+        """Forget a dead driver and free its pool slot"""
+        self._uses.pop(driver, None)
+        slot = self._slots.pop(driver, None)
+        if slot is not None:
+            with self._lock:
+                self._free_slots.add(slot)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def release(self, driver, reuse=True):
+        """Return a driver to the pool, resetting its state for the next use"""
+        if driver is None:
+            return
+
+        # Retire the instance once it has served its quota of scrapes
+        uses = self._uses.get(driver, 0) + 1
+        self._uses[driver] = uses
+        if uses >= self.MAX_USES_PER_INSTANCE:
+            logger.info(f"Retiring pooled browser after {uses} uses")
+            reuse = False
+
+        if reuse and self._reset(driver):
+            self._idle.put(driver)
+            return
+
+        self._discard(driver)
+
+    def _reset(self, driver):
+        """Erase per-video state between uses instead of quitting Chrome"""
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            return True
+        except Exception as reset_error:
+            logger.error(f"Error resetting pooled browser: {reset_error}")
+            return False
+
+    def shutdown(self):
+        """Quit every idle browser in the pool"""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
+
+
+def scrape_eightify_batch(urls, workers=4):
+    """
+    Scrape several YouTube URLs concurrently over a shared browser pool
+
+    Args:
+        urls: Iterable of YouTube video URLs
+        workers: Number of browsers (and threads) to run at once
+
+    Returns:
+        dict: Mapping of video URL to its result dictionary, in input order
+    """
+    urls = list(urls)
+    if not urls:
+        return {}
+
+    pool = EightifyDriverPool(size=min(workers, len(urls)))
+    pool.warm_up()
+
+    def scrape_one(video_url):
+        try:
+            with pool.acquire() as driver:
+                return process_next_url(driver, video_url)
+        except Exception as e:
+            logger.error(f"Error processing {video_url} in batch: {e}")
+            return {
+                "video_url": video_url,
+                "status": "Error",
+                "message": f"Batch worker error: {str(e)}"
+            }
+
+    results = {}
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=pool.size) as executor:
+            for video_url, result in zip(urls, executor.map(scrape_one, urls)):
+                results[video_url] = result
+    finally:
+        pool.shutdown()
+
+    return results
+
+
+async def scrape_eightify_batch_async(urls, workers=4):
+    """
+    Async wrapper around batch scraping for asyncio-based callers
+
+    Selenium's client is synchronous, so each scrape still runs in a
+    worker thread; the semaphore overlaps the long in-browser wait
+    windows across up to `workers` videos while keeping the event loop
+    free for other tasks.
+
+    Args:
+        urls: Iterable of YouTube video URLs
+        workers: Number of browsers (and threads) to run at once
+
+    Returns:
+        dict: Mapping of video URL to its result dictionary, in input order
+    """
+    urls = list(urls)
+    if not urls:
+        return {}
+
+    pool = EightifyDriverPool(size=min(workers, len(urls)))
+    await asyncio.to_thread(pool.warm_up)
+
+    semaphore = asyncio.Semaphore(pool.size)
+
+    def scrape_one(video_url):
+        try:
+            with pool.acquire() as driver:
+                return process_next_url(driver, video_url)
+        except Exception as e:
+            logger.error(f"Error processing {video_url} in batch: {e}")
+            return {
+                "video_url": video_url,
+                "status": "Error",
+                "message": f"Batch worker error: {str(e)}"
+            }
+
+    async def scrape_with_limit(video_url):
+        async with semaphore:
+            return await asyncio.to_thread(scrape_one, video_url)
+
+    try:
+        gathered = await asyncio.gather(
+            *[scrape_with_limit(url) for url in urls])
+    finally:
+        await asyncio.to_thread(pool.shutdown)
+
+    return dict(zip(urls, gathered))
+
+
 def create_empty_input_file(filename):
     """Create an empty input file if it doesn't exist"""
     try:
@@ -1643,24 +2817,28 @@ def create_empty_input_file(filename):
         return False
 
 
-def load_urls_from_file(filename):
-    """Load URLs from a file"""
-    # if not os.path.exists(filename):
-    #     logger.warning(f"Error: {filename} not found.")
-    #     video_url = input("Enter YouTube video URL manually: ")
-    #     return [video_url]
+def iter_urls(filename):
+    """Yield URLs from a file one at a time without building a full list"""
+    with open(filename, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                yield line
 
-    try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            urls = [line.strip() for line in f if line.strip()
-                    and not line.strip().startswith('#')]
 
-        logger.info(f"Found {len(urls)} URLs to process in {filename}")
-        return urls
+def count_urls(filename):
+    """Count the URLs in a file with a cheap line scan
+
+    Returns -1 if the file cannot be read, so callers can distinguish
+    "empty file" from "unreadable file".
+    """
+    try:
+        count = sum(1 for _ in iter_urls(filename))
+        logger.info(f"Found {count} URLs to process in {filename}")
+        return count
     except Exception as e:
         logger.error(f"Error reading input file: {e}")
-        video_url = input("Enter YouTube video URL manually: ")
-        return [video_url]
+        return -1
 
 
 def load_existing_results(output_file):
@@ -1669,8 +2847,12 @@ def load_existing_results(output_file):
 
     if os.path.exists(output_file):
         try:
-            with open(output_file, 'r', encoding='utf-8') as f:
-                all_results = json.load(f)
+            if orjson is not None:
+                with open(output_file, 'rb') as f:
+                    all_results = orjson.loads(f.read())
+            else:
+                with open(output_file, 'r', encoding='utf-8') as f:
+                    all_results = json.load(f)
             logger.info(f"Loaded existing results from {output_file} with {len(all_results)} entries")
         except Exception as e:
             logger.error(f"Error loading existing results: {e}")
@@ -1678,144 +2860,250 @@ def load_existing_results(output_file):
     return all_results
 
 
-def save_results(all_results, output_file):
-    """Save all results to the output file"""
+def _sidecar_dir(output_file):
+    """Directory holding one small JSON file per processed video"""
+    return os.path.splitext(output_file)[0] + "_results"
+
+
+def save_single_result(video_url, url_data, output_file):
+    """
+    Persist one video's result to its own sidecar file
+
+    Each write is O(1) in the number of previously processed URLs, unlike
+    rewriting the merged output. The data lands in a temp file first and
+    is moved into place with os.replace, so a crash mid-write can never
+    truncate an already-saved result.
+    """
+    sidecar_dir = _sidecar_dir(output_file)
     try:
-        # Create directory if it doesn't exist
-        output_dir = os.path.dirname(output_file)
-        if output_dir and not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-            
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(all_results, f, indent=2, ensure_ascii=False)
-        logger.info(f"Updated results saved to {output_file}")
+        os.makedirs(sidecar_dir, exist_ok=True)
+        payload = dict(url_data)
+        payload["video_url"] = video_url
+
+        fd, tmp_path = tempfile.mkstemp(dir=sidecar_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, indent=_JSON_INDENT,
+                          separators=_JSON_SEPARATORS, ensure_ascii=False)
+            os.replace(tmp_path, os.path.join(
+                sidecar_dir, f"{extract_video_id(video_url)}.json"))
+        except Exception:
+            os.unlink(tmp_path)
+            raise
         return True
     except Exception as e:
-        logger.error(f"Error saving results: {e}")
+        logger.error(f"Error saving sidecar result for {video_url}: {e}")
         return False
 
 
-def monkey_patch_webdriver():
-    """Monkey patch the webdriver.Chrome to capture the driver object"""
-    def capture_driver(driver):
-        global global_driver
-        global_driver = driver
-        return driver
+def load_sidecar_results(output_file):
+    """Load every per-video sidecar file into one url -> data dict"""
+    results = {}
+    sidecar_dir = _sidecar_dir(output_file)
+    if not os.path.isdir(sidecar_dir):
+        return results
 
-    original_chrome = webdriver.Chrome
-    webdriver.Chrome = lambda *args, **kwargs: capture_driver(
-        original_chrome(*args, **kwargs))
+    for entry in os.scandir(sidecar_dir):
+        if not entry.name.endswith('.json'):
+            continue
+        try:
+            with open(entry.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            video_url = data.pop("video_url", None)
+            if video_url:
+                results[video_url] = data
+        except Exception as e:
+            logger.error(f"Error loading sidecar result {entry.name}: {e}")
 
-    return original_chrome
+    if results:
+        logger.info(f"Loaded {len(results)} sidecar results from {sidecar_dir}")
+    return results
 
 
-def restore_webdriver(original_chrome):
-    """Restore the original webdriver.Chrome function"""
-    webdriver.Chrome = original_chrome
+def consolidate_results(output_file):
+    """Merge the sidecar files into the legacy single-file output"""
+    merged = load_existing_results(output_file)
+    merged.update(load_sidecar_results(output_file))
+    if merged and save_results(merged, output_file):
+        logger.info(f"Consolidated {len(merged)} results into {output_file}")
+    return merged
 
 
-def process_url(video_url, retry_count=0, max_retries=2):
+def save_results(all_results, output_file):
+    """Save all results to the output file via a temp file and rename"""
+    # Writing to a sibling temp file and renaming keeps the output file
+    # intact if the process dies mid-dump (same pattern as the env cache)
+    tmp_path = None
+    try:
+        out_dir = os.path.dirname(os.path.abspath(output_file))
+        fd, tmp_path = tempfile.mkstemp(
+            dir=out_dir, prefix=os.path.basename(output_file), suffix=".tmp")
+        if orjson is not None:
+            # One dumps + one write call covers the whole file
+            option = orjson.OPT_INDENT_2 if PRETTY_JSON else 0
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps(all_results, option=option))
+        else:
+            # json.dump emits a storm of small writes for a large object;
+            # a 256 KiB buffer batches them into few write() syscalls
+            with os.fdopen(fd, 'w', encoding='utf-8', buffering=262144) as f:
+                json.dump(all_results, f, indent=_JSON_INDENT,
+                          separators=_JSON_SEPARATORS, ensure_ascii=False)
+        os.replace(tmp_path, output_file)
+        tmp_path = None
+        logger.info(f"Updated results saved to {output_file}")
+        return True
+    except Exception as e:
+        logger.error(f"Error saving results: {e}")
+        if tmp_path:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        return False
+
+
+def process_url(video_url, max_retries=2, force=False, refresh=False):
     """
     Process a single YouTube URL with improved caching
 
+    Retries run as an iterative loop rather than recursion, so failed
+    attempts neither grow the call stack nor nest exception handlers.
+
     Args:
         video_url: YouTube video URL
-        retry_count: Current retry attempt
         max_retries: Maximum number of retry attempts
+        force: Skip the cache read and re-scrape (the entry is kept and
+            overwritten on success)
+        refresh: Evict any cached result and re-scrape
 
     Returns:
         tuple: (success, eightify_data)
     """
     global global_driver
 
-    try:
-        # If retry_count > 0, we're in a retry attempt
-        if retry_count > 0:
-            logger.info(f"Retry attempt {retry_count}/{max_retries} for {video_url}")
+    # A TTL cache hit costs microseconds against ~30 s for a browser
+    # session, so check it before touching Chrome at all — unless the
+    # caller asked to bypass (--force) or evict (--refresh) the entry
+    cache = _get_url_cache()
+    if cache is not None:
+        key = _url_cache_key(video_url)
+        if refresh:
+            try:
+                cache.delete(key)
+            except Exception:
+                pass
+        elif not force:
+            try:
+                cached = cache.get(key)
+            except Exception:
+                cached = None
+            if cached and any(cached.get(k) for k in TAB_TYPES):
+                logger.info(f"Serving cached result for {video_url}")
+                return True, cached
 
-            # Force a new browser instance for retries
-            if global_driver is not None:
-                try:
-                    logger.info("Closing existing browser for retry...")
-                    global_driver.quit()
-                except Exception as close_error:
-                    logger.error(f"Error closing browser: {close_error}")
-                finally:
-                    global_driver = None
+    eightify_data = {}
+    for attempt in range(max_retries + 1):
+        try:
+            if attempt > 0:
+                logger.info(f"Retry attempt {attempt}/{max_retries} for {video_url}")
 
-        # Create a new browser instance if needed
-        if global_driver is None:
-            logger.info("\nStarting data extraction with new browser instance...")
-            # Close any existing Chrome instances to avoid conflicts
-            system = platform.system()
-            close_existing_chrome(system)
-            # Initialize a new browser with the first URL
-            eightify_data = scrape_eightify_data(
-                video_url, close_existing=True)
-        else:
-            # For subsequent URLs, first check if the driver is still
-            # responsive
-            try:
-                logger.info("Checking if browser is still responsive...")
-                # Simple operation to check browser responsiveness
-                _ = global_driver.current_url
-                # Force a clean state by refreshing the page
-                global_driver.refresh()
-                
-                # Wait for page refresh to complete
-                try:
-                    WebDriverWait(global_driver, 3).until(
-                        lambda d: d.execute_script("return document.readyState") == "complete"
-                    )
-                except TimeoutException:
-                    # If timeout, use sleep as fallback
-                    time.sleep(3)
-
-                logger.info("Browser is responsive. Trying to process next URL...")
-                # Process the URL in the existing browser
-                eightify_data = process_next_url(global_driver, video_url)
-            except Exception as driver_error:
-                logger.error(f"Browser is not responsive: {driver_error}")
-                logger.info("Creating a new browser instance...")
-                # If driver is not responsive, recreate it
-                try:
-                    if global_driver is not None:
+                # Force a new browser instance for retries
+                if global_driver is not None:
+                    try:
+                        logger.info("Closing existing browser for retry...")
                         global_driver.quit()
-                except Exception:
-                    pass
-                global_driver = None
-                system = platform.system()
+                    except Exception as close_error:
+                        logger.error(f"Error closing browser: {close_error}")
+                    finally:
+                        global_driver = None
+
+            # Before paying a cold start, see if a still-alive session from
+            # a previous launch can be adopted (not on retries: those quit
+            # the browser deliberately because its state is suspect)
+            if global_driver is None and attempt == 0:
+                global_driver = try_reattach_session()
+
+            # Create a new browser instance if needed
+            if global_driver is None:
+                logger.info("\nStarting data extraction with new browser instance...")
+                # Close any existing Chrome instances to avoid conflicts
+                system = SYSTEM
                 close_existing_chrome(system)
-                eightify_data = scrape_eightify_data(
+                # Initialize a new browser with the first URL; the driver
+                # comes back explicitly rather than via a patched
+                # webdriver.Chrome
+                global_driver, eightify_data = scrape_eightify_data(
                     video_url, close_existing=True)
+            else:
+                # For subsequent URLs, first check if the driver is still
+                # responsive
+                try:
+                    logger.info("Checking if browser is still responsive...")
+                    # Cheapest possible liveness probe: Browser.getVersion
+                    # answers from chromedriver/Chrome without touching the
+                    # page at all. No refresh here — process_next_url's own
+                    # get() navigates away from the old page anyway
+                    try:
+                        global_driver.execute_cdp_cmd("Browser.getVersion", {})
+                    except AttributeError:
+                        # Reattached Remote drivers lack execute_cdp_cmd
+                        _ = global_driver.title
+
+                    logger.info("Browser is responsive. Trying to process next URL...")
+                    # Process the URL in the existing browser
+                    eightify_data = process_next_url(global_driver, video_url)
+                except Exception as driver_error:
+                    logger.error(f"Browser is not responsive: {driver_error}")
+                    logger.info("Creating a new browser instance...")
+                    # If driver is not responsive, recreate it
+                    try:
+                        if global_driver is not None:
+                            global_driver.quit()
+                    except Exception:
+                        pass
+                    global_driver = None
+                    system = SYSTEM
+                    close_existing_chrome(system)
+                    global_driver, eightify_data = scrape_eightify_data(
+                        video_url, close_existing=True)
+
+            # Check if extraction was successful
+            if (eightify_data.get("status") == "Success" or
+                    any(eightify_data.get(key, "") for key in TAB_TYPES)):
+                logger.info(f"Successfully extracted data for {video_url}")
+                if cache is not None:
+                    try:
+                        cache.set(_url_cache_key(video_url), eightify_data,
+                                  expire=URL_CACHE_TTL_SECONDS)
+                    except Exception as cache_error:
+                        logger.debug(f"Could not cache result: {cache_error}")
+                return True, eightify_data
+
+            logger.warning(f"Extraction failed: {eightify_data.get('message', 'No error message')}")
+
+        except Exception as extraction_error:
+            logger.error(f"Error during extraction: {extraction_error}")
+            eightify_data = {
+                "video_url": video_url,
+                "status": "Error",
+                "message": f"Extraction failed: {str(extraction_error)}"
+            }
+            if attempt < max_retries:
+                if isinstance(extraction_error,
+                              (NoSuchWindowException, InvalidSessionIdException)):
+                    # The session itself is gone; waiting won't bring it
+                    # back, so retry immediately with a fresh browser
+                    logger.info("Browser session lost; retrying with a new instance")
+                else:
+                    # Exponential backoff with jitter so a transient blip
+                    # costs a short wait on the first retry instead of a
+                    # flat five seconds, while repeat failures back off
+                    delay = min(2 ** (attempt + 1), 30) + random.uniform(0, 1)
+                    logger.info(f"Waiting {delay:.1f}s before retrying...")
+                    time.sleep(delay)
 
-        # Check if extraction was successful
-        if (eightify_data.get("status") == "Success" or
-                any(eightify_data.get(key, "") for key in TAB_TYPES)):
-            logger.info(f"Successfully extracted data for {video_url}")
-            return True, eightify_data
-
-        logger.warning(f"Extraction failed: {eightify_data.get('message', 'No error message')}")
-
-        # If we haven't exceeded retry attempts, try again
-        if retry_count < max_retries:
-            return process_url(video_url, retry_count + 1, max_retries)
-
-        return False, eightify_data
-
-    except Exception as extraction_error:
-        logger.error(f"Error during extraction: {extraction_error}")
-
-        # If we haven't exceeded retry attempts, try again
-        if retry_count < max_retries:
-            time.sleep(5)  # Wait before retrying
-            return process_url(video_url, retry_count + 1, max_retries)
-
-        return False, {
-            "video_url": video_url,
-            "status": "Error",
-            "message": f"Extraction failed after {max_retries} retries: {str(extraction_error)}"
-        }
+    return False, eightify_data
 
 
 def prepare_browser_for_next_url():
@@ -1832,14 +3120,23 @@ def prepare_browser_for_next_url():
 
     try:
         logger.info("Creating a clean new tab for next URL...")
-        # Create a new tab
-        global_driver.execute_script("window.open('about:blank', '_blank');")
-        time.sleep(2)
-        # Close the old tab
-        global_driver.switch_to.window(global_driver.window_handles[-1])
-        global_driver.close()
-        global_driver.switch_to.window(global_driver.window_handles[0])
-        time.sleep(2)
+        # Recycle the tab through CDP: createTarget/closeTarget return
+        # only once the browser has acknowledged the transition, so no
+        # settle waits are needed around them
+        old_handle = global_driver.current_window_handle
+        prev_handles = set(global_driver.window_handles)
+        global_driver.execute_cdp_cmd(
+            "Target.createTarget", {"url": "about:blank"})
+        WebDriverWait(global_driver, 5, poll_frequency=0.1).until(
+            lambda d: len(d.window_handles) > len(prev_handles))
+        new_handle = next(
+            h for h in global_driver.window_handles if h not in prev_handles)
+        global_driver.switch_to.window(new_handle)
+        # chromedriver window handles are "CDwindow-<targetId>", so the
+        # old tab can be closed by target id without switching back
+        global_driver.execute_cdp_cmd(
+            "Target.closeTarget",
+            {"targetId": old_handle.replace("CDwindow-", "")})
         logger.info("Ready to process next URL in clean tab...")
         return True
     except Exception as tab_error:
@@ -1868,19 +3165,19 @@ def keep_browser_open():
     logger.info("=============================================")
     logger.info("Press Ctrl+C when you want to close the browser")
 
+    # Park on an Event instead of a poll loop: no Selenium RPC every 5 s
+    # just to print a line, and the process is truly idle between the
+    # occasional health log. If the browser is closed externally the next
+    # run detects it on its own.
+    stop = threading.Event()
+    previous_handler = signal.signal(signal.SIGINT, lambda *args: stop.set())
+
     try:
-        while True:
-            time.sleep(5)  # Sleep to reduce CPU usage
-            # Check if the driver is still responsive
-            try:
-                current_url = global_driver.current_url
-                logger.info(f"Browser still open at: {current_url}")
-            except Exception:
-                logger.warning("Browser was closed externally")
-                break
-    except KeyboardInterrupt:
+        while not stop.wait(timeout=60):
+            logger.info("Browser still open (press Ctrl+C to close)")
         logger.info("\nKeyboard interrupt detected")
     finally:
+        signal.signal(signal.SIGINT, previous_handler)
         try:
             if global_driver:
                 global_driver.quit()
@@ -1888,60 +3185,103 @@ def keep_browser_open():
             pass
 
 
-def process_urls(urls_to_process, output_file):
+def process_urls(urls_to_process, output_file, total=None, force=False,
+                 refresh=False):
     """
-    Process a list of YouTube URLs
+    Process an iterable of YouTube URLs
 
     Args:
-        urls_to_process: List of YouTube URLs to process
+        urls_to_process: Iterable of YouTube URLs to process (may be a
+            generator; it is consumed exactly once)
         output_file: Path to output file
+        total: Number of URLs in the iterable, for progress logging.
+            If omitted, the iterable is materialized to count it.
+        force: Re-scrape URLs even when a cached result exists
+        refresh: Evict per-URL cache entries before scraping
     """
-    # Initialize results dictionary
+    if total is None:
+        urls_to_process = list(urls_to_process)
+        total = len(urls_to_process)
+
+    # Ensure the output directory exists once up front instead of
+    # stat()ing it on every save; exist_ok also avoids the TOCTOU race
+    # between check and create
+    output_dir = os.path.dirname(output_file)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    # Initialize results dictionary, folding in any sidecar files written
+    # by interrupted runs that never got consolidated
     all_results = load_existing_results(output_file)
-
-    # Store the driver in the global variable
-    original_chrome = monkey_patch_webdriver()
+    all_results.update(load_sidecar_results(output_file))
+
+    # Membership set for skip checks, so the loop never touches the big
+    # result dict (which holds full transcripts) just to test presence
+    processed_urls = set(all_results)
+
+    # Throttle the full-file rewrite: saving after every URL rewrites the
+    # whole accumulated result set each time, so flushes happen at most
+    # every RESULTS_FLUSH_SECONDS or RESULTS_FLUSH_COUNT new entries,
+    # with an unconditional flush on exit (including crashes, via atexit)
+    flush_state = {"dirty": False, "pending": 0, "last_ts": time.monotonic()}
+
+    def flush_results(force=False):
+        if not flush_state["dirty"]:
+            return
+        if (not force and flush_state["pending"] < RESULTS_FLUSH_COUNT and
+                time.monotonic() - flush_state["last_ts"] < RESULTS_FLUSH_SECONDS):
+            return
+        if save_results(all_results, output_file):
+            flush_state["dirty"] = False
+            flush_state["pending"] = 0
+            flush_state["last_ts"] = time.monotonic()
+
+    atexit.register(flush_results, True)
 
     try:
         # Process each URL
         for i, video_url in enumerate(urls_to_process):
-            # Skip URLs that have already been processed
-            if video_url in all_results:
-                logger.warning(f"\n[{i + 1}/{len(urls_to_process)}] Skipping already processed URL: {video_url}")
-                continue
+            # A cache hit costs nothing while a re-scrape costs a full
+            # Chrome session, so only successful extractions count as
+            # hits — failed entries get another attempt on re-runs
+            if not force and video_url in processed_urls:
+                if _has_extracted_content(all_results.get(video_url)):
+                    logger.warning(f"\n[{i + 1}/{total}] Skipping already processed URL: {video_url}")
+                    continue
+                logger.info(f"\n[{i + 1}/{total}] Retrying previously failed URL: {video_url}")
 
-            logger.info(f"\n[{i + 1}/{len(urls_to_process)}] Processing: {video_url}")
+            logger.info(f"\n[{i + 1}/{total}] Processing: {video_url}")
 
             # Disable warnings
             warnings.filterwarnings("ignore", category=DeprecationWarning)
 
             # Process the URL
-            success, eightify_data = process_url(video_url)
+            success, eightify_data = process_url(
+                video_url, force=force, refresh=refresh)
 
             # Create the data structure for this URL
-            url_data = {
-                "key_insights": eightify_data.get(
-                    "key_insights", ""), "timestamped_summary": eightify_data.get(
-                    "timestamped_summary", ""), "top_comments": eightify_data.get(
-                    "top_comments", ""), "transcript": eightify_data.get(
-                    "transcript", "")}
-
-            # Add to results
-            all_results[video_url] = url_data
+            url_data = {key: eightify_data.get(key, "") for key in RESULT_KEYS}
 
-            # Save all results after each URL is processed
-            save_results(all_results, output_file)
-
-            if not success:
+            # Persist this URL immediately as an O(1) sidecar write, then
+            # refresh the merged file if the throttle window allows
+            all_results[video_url] = url_data
+            processed_urls.add(video_url)
+            save_single_result(video_url, url_data, output_file)
+            flush_state["dirty"] = True
+            flush_state["pending"] += 1
+            flush_results()
+
+            # One scan over the result keys serves both the success check
+            # and the per-tab count
+            tabs_with_data = [key for key in RESULT_KEYS if url_data.get(key)]
+            if not (success or tabs_with_data):
                 logger.error(f"\n❌ Failed to extract data for {video_url}")
             else:
                 logger.info(f"\n✅ Successfully extracted data for {video_url}!")
-                items_found = sum(
-                    1 for key, value in url_data.items() if value)
-                logger.info(f"Found data in {items_found}/{len(TAB_TYPES)} tabs")
+                logger.info(f"Found data in {len(tabs_with_data)}/{len(TAB_TYPES)} tabs")
 
             # Reset browser between videos if needed
-            if not success or i == len(urls_to_process) - 1:
+            if not success or i == total - 1:
                 continue
 
             # Prepare browser for next URL
@@ -1954,8 +3294,269 @@ def process_urls(urls_to_process, output_file):
         logger.error(f"Error in main program: {e}")
         traceback.print_exc()
     finally:
-        # Restore original Chrome class
-        restore_webdriver(original_chrome)
+        # Persist whatever accumulated before exiting
+        flush_results(force=True)
+        atexit.unregister(flush_results)
+
+
+def prefilter_urls(urls, max_workers=16, timeout=5):
+    """
+    Split URLs into reachable and unavailable via cheap oembed probes
+
+    A dead or private video still costs a full browser session plus
+    retries (~30 s) before it lands as a failure; a concurrent oembed
+    request answers the same question in tens of milliseconds. Only
+    statuses that mean the video itself is gone count as unavailable:
+    401/403 just mean embedding is disabled (the watch page still
+    scrapes fine), 429 is oembed rate-limiting our own probe burst, and
+    network errors, timeouts and 5xx all pass the URL through so the
+    browser gets its chance.
+
+    Args:
+        urls: List of YouTube URLs to probe
+        max_workers: Concurrent probe threads
+        timeout: Per-request timeout in seconds
+
+    Returns:
+        tuple: (list of live URLs in input order, dict of unavailable
+        URL -> error-shaped result entry)
+    """
+    import requests
+
+    dead_statuses = {400, 404, 410}
+
+    def probe(video_url):
+        try:
+            response = requests.head(
+                "https://www.youtube.com/oembed",
+                params={"url": video_url, "format": "json"},
+                timeout=timeout, allow_redirects=True)
+            return response.status_code in dead_statuses
+        except Exception:
+            return False
+
+    live, unavailable = [], {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for video_url, dead in zip(urls, executor.map(probe, urls)):
+            if dead:
+                logger.warning(f"URL unavailable, skipping browser: {video_url}")
+                unavailable[video_url] = {key: "" for key in RESULT_KEYS}
+            else:
+                live.append(video_url)
+
+    if unavailable:
+        logger.info(f"Prefilter marked {len(unavailable)} of {len(urls)} URLs unavailable")
+    return live, unavailable
+
+
+def _has_extracted_content(url_data):
+    """True when a stored result holds at least one non-empty tab"""
+    return bool(url_data) and any(url_data.get(key) for key in RESULT_KEYS)
+
+
+def _writer_loop(write_q, all_results, output_file):
+    """
+    Drain result writes on a dedicated thread until a None sentinel
+
+    Each (video_url, url_data) item gets its O(1) sidecar write
+    immediately; the expensive merged-file rewrite runs once per drained
+    batch, so bursts of worker completions coalesce naturally.
+    """
+    done = False
+    while not done:
+        batch = [write_q.get()]
+        while True:
+            try:
+                batch.append(write_q.get_nowait())
+            except queue.Empty:
+                break
+
+        wrote = False
+        for item in batch:
+            if item is None:
+                done = True
+                continue
+            video_url, url_data = item
+            all_results[video_url] = url_data
+            save_single_result(video_url, url_data, output_file)
+            wrote = True
+        if wrote:
+            save_results(all_results, output_file)
+
+
+def process_urls_parallel(urls_to_process, output_file, workers=4,
+                          force=False, refresh=False):
+    """
+    Process YouTube URLs concurrently over a shared driver pool
+
+    Scraping is I/O-bound (page loads and Selenium round-trips release
+    the GIL), so K workers over K pooled browsers give close to K-fold
+    throughput on long URL lists. Finished results are queued to a
+    dedicated writer thread that owns the result dict and coalesces
+    merged-file rewrites, so persistence never blocks the coordinator.
+
+    Args:
+        urls_to_process: Iterable of YouTube URLs to process
+        output_file: Path to output file
+        workers: Number of browsers (and threads) to run at once
+        force: Re-scrape every URL, including already-successful ones
+        refresh: Evict TTL cache entries for the URLs being scraped
+    """
+    output_dir = os.path.dirname(output_file)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    all_results = load_existing_results(output_file)
+    all_results.update(load_sidecar_results(output_file))
+
+    # Dedupe while preserving order, then drop already-successful URLs
+    # in one pass so the worker loop never branches on skips. Same
+    # semantics as the serial loop: only entries with real tab content
+    # count as done, so failed all-empty entries get retried — and
+    # --force skips the filter entirely
+    unique_urls = list(dict.fromkeys(urls_to_process))
+    if force:
+        pending = unique_urls
+    else:
+        pending = [url for url in unique_urls
+                   if not _has_extracted_content(all_results.get(url))]
+    logger.info(f"{len(pending)} URLs to scrape, "
+                f"{len(unique_urls) - len(pending)} already successful")
+    if not pending:
+        logger.info("All URLs already processed, nothing to do")
+        return
+
+    # Pooled scraping never reads the TTL cache, but serial runs do —
+    # evict the entries being re-scraped so they can't serve stale later
+    if refresh:
+        cache = _get_url_cache()
+        if cache is not None:
+            for video_url in pending:
+                try:
+                    cache.delete(_url_cache_key(video_url))
+                except Exception:
+                    pass
+
+    # Weed out dead/private videos before tying up browser slots on them
+    pending, unavailable = prefilter_urls(pending)
+    for video_url, url_data in unavailable.items():
+        all_results[video_url] = url_data
+        save_single_result(video_url, url_data, output_file)
+    if unavailable:
+        save_results(all_results, output_file)
+    if not pending:
+        logger.info("No reachable URLs left to process")
+        return
+
+    logger.info(f"Processing {len(pending)} URLs with {workers} workers")
+
+    pool = EightifyDriverPool(size=min(workers, len(pending)))
+    pool.warm_up()
+
+    def process_one(video_url):
+        with pool.acquire() as driver:
+            return process_next_url(driver, video_url)
+
+    # All persistence happens on a single writer thread fed through a
+    # queue: the coordinator hands results over and moves on, and bursts
+    # of completions coalesce into one merged-file rewrite per drain
+    # instead of one per URL
+    write_q = queue.Queue()
+    writer = threading.Thread(
+        target=_writer_loop, args=(write_q, all_results, output_file),
+        daemon=True)
+    writer.start()
+
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=pool.size) as executor:
+            futures = {executor.submit(process_one, url): url
+                       for url in pending}
+            for future in concurrent.futures.as_completed(futures):
+                video_url = futures[future]
+                try:
+                    eightify_data = future.result()
+                except Exception as e:
+                    logger.error(f"Error processing {video_url}: {e}")
+                    eightify_data = {}
+
+                url_data = {key: eightify_data.get(key, "")
+                            for key in RESULT_KEYS}
+                write_q.put((video_url, url_data))
+
+                if any(url_data.values()):
+                    logger.info(f"✅ Successfully extracted data for {video_url}")
+                else:
+                    logger.error(f"❌ Failed to extract data for {video_url}")
+    finally:
+        write_q.put(None)
+        writer.join()
+        pool.shutdown()
+
+
+async def process_urls_async(urls_to_process, output_file, workers=4,
+                             force=False, refresh=False):
+    """
+    Async counterpart of process_urls_parallel for asyncio-based callers
+
+    Scraping runs through scrape-per-URL worker threads as in the sync
+    path, but result persistence is dispatched with asyncio.to_thread as
+    each scrape lands, so disk flushes overlap the remaining scraping
+    instead of serializing behind it. The input file itself is tiny;
+    reading it stays synchronous on purpose.
+
+    Args:
+        urls_to_process: Iterable of YouTube URLs to process
+        output_file: Path to output file
+        workers: Number of browsers (and threads) to run at once
+        force: Re-scrape every URL, including already-successful ones
+        refresh: Evict TTL cache entries for the URLs being scraped
+    """
+    output_dir = os.path.dirname(output_file)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    all_results = await asyncio.to_thread(load_existing_results, output_file)
+    all_results.update(
+        await asyncio.to_thread(load_sidecar_results, output_file))
+
+    # Dedupe while preserving order, then drop already-successful URLs
+    # in one pass so the worker loop never branches on skips. Same
+    # semantics as the serial loop: only entries with real tab content
+    # count as done, so failed all-empty entries get retried — and
+    # --force skips the filter entirely
+    unique_urls = list(dict.fromkeys(urls_to_process))
+    if force:
+        pending = unique_urls
+    else:
+        pending = [url for url in unique_urls
+                   if not _has_extracted_content(all_results.get(url))]
+    logger.info(f"{len(pending)} URLs to scrape, "
+                f"{len(unique_urls) - len(pending)} already successful")
+    if not pending:
+        logger.info("All URLs already processed, nothing to do")
+        return all_results
+
+    # Pooled scraping never reads the TTL cache, but serial runs do —
+    # evict the entries being re-scraped so they can't serve stale later
+    if refresh:
+        cache = _get_url_cache()
+        if cache is not None:
+            for video_url in pending:
+                try:
+                    cache.delete(_url_cache_key(video_url))
+                except Exception:
+                    pass
+
+    scraped = await scrape_eightify_batch_async(pending, workers=workers)
+
+    for video_url, eightify_data in scraped.items():
+        url_data = {key: eightify_data.get(key, "") for key in RESULT_KEYS}
+        all_results[video_url] = url_data
+        await asyncio.to_thread(
+            save_single_result, video_url, url_data, output_file)
+
+    await asyncio.to_thread(save_results, all_results, output_file)
+    return all_results
 
 
 def print_system_info():
@@ -1963,7 +3564,7 @@ def print_system_info():
     logger.info("\n===== Eightify Data Extractor =====")
 
     # Print system info
-    system = platform.system()
+    system = SYSTEM
     logger.info(f"Operating System: {system}")
     chrome_version = get_chrome_version()
     logger.info(f"Chrome Version: {chrome_version}")
@@ -2017,16 +3618,41 @@ def main():
         input_file = "video_urls.txt"
         output_file = "eightify_data.json"
 
+        # --force re-scrapes every URL, ignoring cached successes;
+        # --refresh additionally evicts the per-URL TTL cache entries;
+        # --workers N runs N pooled browsers instead of the serial loop
+        args = sys.argv[1:]
+        force = "--force" in args
+        refresh = "--refresh" in args
+        workers = 1
+        if "--workers" in args:
+            try:
+                workers = max(1, int(args[args.index("--workers") + 1]))
+            except (IndexError, ValueError):
+                logger.warning("--workers needs a number, e.g. --workers 4; "
+                               "running serially")
+
         # Create input file if it doesn't exist
         if not os.path.exists(input_file):
             create_empty_input_file(input_file)
 
-        # Load URLs from file
-        urls_to_process = load_urls_from_file(input_file)
+        # Count URLs up front, then stream them so the full list is
+        # never held in memory
+        total = count_urls(input_file)
 
         # Process URLs
-        if urls_to_process:
-            process_urls(urls_to_process, output_file)
+        if total > 0:
+            if workers > 1:
+                process_urls_parallel(list(iter_urls(input_file)),
+                                      output_file, workers=workers,
+                                      force=force, refresh=refresh)
+            else:
+                process_urls(iter_urls(input_file), output_file, total,
+                             force=force, refresh=refresh)
+        elif total < 0:
+            video_url = input("Enter YouTube video URL manually: ")
+            process_urls([video_url], output_file, 1,
+                         force=force, refresh=refresh)
         else:
             logger.warning("No URLs to process. Please add YouTube URLs to the input file.")
 